@@ -26,8 +26,14 @@ from src.main.app import app as clean_app
 from src.core.entities.audio_data import AudioData
 from src.infrastructure.config.settings import settings
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Handle orjson import gracefully (faster SSE payload encoding)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure logging (LOG_LEVEL from .env / environment, e.g. DEBUG for per-chunk audio timings)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +60,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     try:
         clean_app.cleanup()
+        await clean_app.aclose()
         logger.info("🧹 Application cleanup completed")
     except Exception as e:
         logger.error(f"❌ Error during cleanup: {e}")
@@ -76,6 +83,16 @@ static_dir.mkdir(exist_ok=True)
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+def _to_json(payload: Dict) -> str:
+    """Serialize a streaming payload, preferring orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload)
+
+# Streaming frames whose fields are sent to the client unchanged
+_PASSTHROUGH_FRAME_TYPES = frozenset({"streaming_chunk", "text_chunk", "sentence_audio_error"})
+
+
 # Pydantic models
 class TextRequest(BaseModel):
     text: str
@@ -125,7 +142,7 @@ async def voice_therapy(
     Complete voice therapy interaction
     Processes audio input and returns therapeutic response with audio
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         # Generate session ID if not provided
@@ -180,7 +197,7 @@ async def voice_therapy(
             audio_url = f"/static/{audio_filename}"
         
         # Calculate latency
-        latency = time.time() - start_time
+        latency = time.perf_counter() - start_time
         
         return TherapyResponse(
             success=True,
@@ -218,8 +235,14 @@ async def streaming_therapy(request: TextRequest):
                 request.text, 
                 session_id
             ):
+                chunk_type = chunk.get("type")
+                
+                # Text frames already have their wire shape; forward them without copying
+                if chunk_type in _PASSTHROUGH_FRAME_TYPES:
+                    yield f"data: {_to_json(chunk)}\n\n"
+                    
                 # Handle different chunk types
-                if chunk.get("type") == "complete_response":
+                elif chunk_type == "complete_response":
                     # Final response (no merged audio)
                     final_response = {
                         "type": "complete_response",
@@ -230,9 +253,9 @@ async def streaming_therapy(request: TextRequest):
                         "success": chunk.get("success", True)
                     }
                     
-                    yield f"data: {json.dumps(final_response)}\n\n"
+                    yield f"data: {_to_json(final_response)}\n\n"
                     
-                elif chunk.get("type") == "realtime_audio_chunk":
+                elif chunk_type == "realtime_audio_chunk":
                     # Real-time streaming audio chunk - save and send immediately
                     audio_url = None
                     if chunk.get("audio_data") and chunk["audio_data"].audio_bytes:
@@ -257,9 +280,9 @@ async def streaming_therapy(request: TextRequest):
                         "partial_response": chunk.get("partial_response", "")
                     }
                     
-                    yield f"data: {json.dumps(audio_response)}\n\n"
+                    yield f"data: {_to_json(audio_response)}\n\n"
                     
-                elif chunk.get("type") == "sentence_audio_complete":
+                elif chunk_type == "sentence_audio_complete":
                     # Complete audio for a sentence - save and send
                     audio_url = None
                     if chunk.get("audio_data") and chunk["audio_data"].audio_bytes:
@@ -284,45 +307,9 @@ async def streaming_therapy(request: TextRequest):
                         "partial_response": chunk.get("partial_response", "")
                     }
                     
-                    yield f"data: {json.dumps(audio_response)}\n\n"
-                    
-                elif chunk.get("type") == "sentence_audio_error":
-                    # Audio processing error for a sentence
-                    error_response = {
-                        "type": "sentence_audio_error",
-                        "content": chunk.get("content", ""),
-                        "session_id": chunk.get("session_id"),
-                        "chunk_id": chunk.get("chunk_id", 0),
-                        "error": chunk.get("error", "Unknown audio error"),
-                        "partial_response": chunk.get("partial_response", "")
-                    }
-                    
-                    yield f"data: {json.dumps(error_response)}\n\n"
-                    
-                elif chunk.get("type") == "text_chunk":
-                    # Individual sentence processed
-                    sentence_response = {
-                        "type": "text_chunk",
-                        "content": chunk.get("content", ""),
-                        "session_id": chunk.get("session_id"),
-                        "chunk_id": chunk.get("chunk_id", 0),
-                        "partial_response": chunk.get("partial_response", "")
-                    }
-                    
-                    yield f"data: {json.dumps(sentence_response)}\n\n"
-                    
-                elif chunk.get("type") == "streaming_chunk":
-                    # Real-time streaming content
-                    streaming_response = {
-                        "type": "streaming_chunk",
-                        "content": chunk.get("content", ""),
-                        "session_id": chunk.get("session_id"),
-                        "partial_response": chunk.get("partial_response", "")
-                    }
-                    
-                    yield f"data: {json.dumps(streaming_response)}\n\n"
+                    yield f"data: {_to_json(audio_response)}\n\n"
                     
-                elif chunk.get("type") == "error":
+                elif chunk_type == "error":
                     # Error response
                     error_response = {
                         "type": "error",
@@ -331,7 +318,7 @@ async def streaming_therapy(request: TextRequest):
                         "success": False
                     }
                     
-                    yield f"data: {json.dumps(error_response)}\n\n"
+                    yield f"data: {_to_json(error_response)}\n\n"
                     break
         
         # Return streaming response
@@ -355,7 +342,7 @@ async def streaming_therapy(request: TextRequest):
         }
         
         async def error_stream():
-            yield f"data: {json.dumps(error_response)}\n\n"
+            yield f"data: {_to_json(error_response)}\n\n"
         
         return StreamingResponse(
             error_stream(),
@@ -425,7 +412,7 @@ async def get_therapy_response(request: TextRequest):
 async def text_to_speech_endpoint(request: TextRequest):
     """Convert text to speech using OpenAI TTS with parallel processing"""
     try:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Always use parallel processing regardless of text length
         text_length = len(request.text)
@@ -452,7 +439,7 @@ async def text_to_speech_endpoint(request: TextRequest):
         async with aiofiles.open(audio_path, "wb") as f:
             await f.write(audio_data.audio_bytes)
         
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         
         return {
             "audio_url": f"/static/{audio_filename}",
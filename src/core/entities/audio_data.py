@@ -3,18 +3,21 @@
 AudioData Entity - Domain model for audio processing
 """
 
+import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Optional, Any
-from uuid import uuid4
 
+# Audio formats accepted by AudioData.is_valid
+_VALID_FORMATS: frozenset = frozenset({"wav", "mp3", "m4a", "ogg"})
 
-@dataclass
+
+@dataclass(slots=True)
 class AudioData:
     """
     Domain entity representing audio data and processing metadata
     """
-    audio_id: str = field(default_factory=lambda: str(uuid4()))
+    audio_id: str = field(default_factory=lambda: secrets.token_hex(16))
     audio_bytes: bytes = field(default_factory=bytes)
     format: str = "wav"  # Following user preference for wav format
     duration: Optional[float] = None
@@ -34,7 +37,7 @@ class AudioData:
         """Check if audio data is valid"""
         return (
             len(self.audio_bytes) > 0 and
-            self.format in ["wav", "mp3", "m4a", "ogg"] and
+            self.format in _VALID_FORMATS and
             self.file_size is not None and
             self.file_size > 100  # Minimum file size check
         )
@@ -65,7 +68,7 @@ class AudioData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedAudioData:
     """
     Domain entity representing processed audio data (e.g., transcription results)
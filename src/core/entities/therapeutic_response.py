@@ -3,10 +3,10 @@
 TherapeuticResponse Entity - Domain model for therapeutic responses
 """
 
+import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from uuid import uuid4
+from typing import Dict, List, Optional, Any, Set
 from enum import Enum
 
 
@@ -37,7 +37,12 @@ class EmotionType(Enum):
     GRIEVING = "grieving"
 
 
-@dataclass
+# Precomputed enum -> value lookups used when emitting response metrics
+_ALERT_LEVEL_VALUES: Dict[AlertLevel, str] = {level: level.value for level in AlertLevel}
+_EMOTION_VALUES: Dict[EmotionType, str] = {emotion: emotion.value for emotion in EmotionType}
+
+
+@dataclass(slots=True)
 class EmotionAnalysis:
     """Analysis of detected emotions"""
     primary_emotion: EmotionType
@@ -54,7 +59,7 @@ class EmotionAnalysis:
         return [self.primary_emotion] + self.secondary_emotions
 
 
-@dataclass
+@dataclass(slots=True)
 class SafetyAssessment:
     """Safety assessment results"""
     alert_level: AlertLevel
@@ -73,12 +78,12 @@ class SafetyAssessment:
         return self.alert_level in [AlertLevel.YELLOW, AlertLevel.ORANGE, AlertLevel.RED]
 
 
-@dataclass
+@dataclass(slots=True)
 class TherapeuticResponse:
     """
     Domain entity representing a therapeutic response from AI
     """
-    response_id: str = field(default_factory=lambda: str(uuid4()))
+    response_id: str = field(default_factory=lambda: secrets.token_hex(16))
     content: str = ""
     session_id: str = ""
     user_input: str = ""
@@ -90,6 +95,13 @@ class TherapeuticResponse:
     cultural_approaches: List[str] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _techniques_set: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _approaches_set: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Seed membership sets used to deduplicate techniques and approaches"""
+        self._techniques_set = set(self.therapeutic_techniques)
+        self._approaches_set = set(self.cultural_approaches)
     
     def is_safe_response(self) -> bool:
         """Check if response is safe"""
@@ -117,34 +129,37 @@ class TherapeuticResponse:
     
     def add_therapeutic_technique(self, technique: str):
         """Add a therapeutic technique used"""
-        if technique not in self.therapeutic_techniques:
+        if technique not in self._techniques_set:
+            self._techniques_set.add(technique)
             self.therapeutic_techniques.append(technique)
     
     def add_cultural_approach(self, approach: str):
         """Add a cultural approach used"""
-        if approach not in self.cultural_approaches:
+        if approach not in self._approaches_set:
+            self._approaches_set.add(approach)
             self.cultural_approaches.append(approach)
     
     def get_response_metrics(self) -> Dict[str, Any]:
         """Get response metrics"""
+        safety = self.safety_assessment
         return {
             "response_id": self.response_id,
             "session_id": self.session_id,
             "model_used": self.model_used,
             "content_length": len(self.content),
             "processing_time": self.processing_time,
-            "alert_level": self.safety_assessment.alert_level.value if self.safety_assessment else "unknown",
-            "primary_emotion": self.get_primary_emotion().value if self.get_primary_emotion() else "unknown",
+            "alert_level": _ALERT_LEVEL_VALUES.get(safety.alert_level, "unknown") if safety else "unknown",
+            "primary_emotion": _EMOTION_VALUES.get(self.get_primary_emotion(), "unknown"),
             "emotion_intensity": self.get_emotion_intensity(),
             "therapeutic_techniques": self.therapeutic_techniques,
             "cultural_approaches": self.cultural_approaches,
-            "requires_intervention": self.safety_assessment.requires_intervention if self.safety_assessment else False,
-            "requires_referral": self.safety_assessment.requires_referral if self.safety_assessment else False,
+            "requires_intervention": safety.requires_intervention if safety else False,
+            "requires_referral": safety.requires_referral if safety else False,
             "created_at": self.created_at.isoformat()
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelValidationResponse:
     """
     Domain entity for model validation responses (GPT vs Claude)
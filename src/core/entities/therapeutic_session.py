@@ -3,13 +3,14 @@
 TherapeuticSession Entity - Domain model for therapy sessions
 """
 
+import secrets
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from uuid import uuid4
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationEntry:
     """Represents a single conversation entry"""
     role: str  # 'user' or 'assistant'
@@ -18,49 +19,151 @@ class ConversationEntry:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+class ConversationLog:
+    """
+    Conversation history stored column-wise (one list per field).
+    Bulk scans such as role counts and context export walk a single list
+    instead of chasing one ConversationEntry object per message.
+    """
+    __slots__ = ("roles", "contents", "timestamps", "metadata", "_context")
+    
+    def __init__(self, entries: Iterable[ConversationEntry] = ()):
+        self.roles: List[str] = []
+        self.contents: List[str] = []
+        self.timestamps: List[datetime] = []
+        self.metadata: List[Dict[str, Any]] = []
+        self._context: Optional[List[Dict[str, str]]] = None  # Cached to_context() result
+        for entry in entries:
+            self.append(entry.role, entry.content, entry.timestamp, entry.metadata)
+    
+    def append(self, role: str, content: str, timestamp: datetime, metadata: Dict[str, Any]):
+        """Append a conversation entry"""
+        self.roles.append(role)
+        self.contents.append(content)
+        self.timestamps.append(timestamp)
+        self.metadata.append(metadata)
+        self._context = None
+    
+    def trim(self, length: int):
+        """Keep only the most recent `length` entries"""
+        excess = len(self.roles) - max(length, 0)
+        if excess > 0:
+            del self.roles[:excess]
+            del self.contents[:excess]
+            del self.timestamps[:excess]
+            del self.metadata[:excess]
+            self._context = None
+    
+    def tail(self, count: int) -> List[ConversationEntry]:
+        """Get the most recent `count` entries"""
+        start = max(len(self.roles) - count, 0)
+        return [self[i] for i in range(start, len(self.roles))]
+    
+    def count_role(self, role: str) -> int:
+        """Count entries for a role"""
+        return self.roles.count(role)
+    
+    def to_context(self) -> List[Dict[str, str]]:
+        """Get entries as role/content dicts
+        
+        The dicts are built once and cached until the log changes; each call returns a new
+        list of them, so callers may extend or reorder it without touching the cache.
+        """
+        if self._context is None:
+            self._context = [
+                {"role": role, "content": content}
+                for role, content in zip(self.roles, self.contents)
+            ]
+        return list(self._context)
+    
+    def __len__(self) -> int:
+        return len(self.roles)
+    
+    def __iter__(self) -> Iterator[ConversationEntry]:
+        for role, content, timestamp, metadata in zip(self.roles, self.contents, self.timestamps, self.metadata):
+            yield ConversationEntry(role, content, timestamp, metadata)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[ConversationEntry, List[ConversationEntry]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.roles)))]
+        return ConversationEntry(self.roles[index], self.contents[index], self.timestamps[index], self.metadata[index])
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ConversationLog):
+            return NotImplemented
+        return (
+            self.roles == other.roles and
+            self.contents == other.contents and
+            self.timestamps == other.timestamps and
+            self.metadata == other.metadata
+        )
+    
+    def __repr__(self) -> str:
+        return f"ConversationLog(entries={len(self.roles)})"
+
+
+@dataclass(slots=True)
 class TherapeuticSession:
     """
     Domain entity representing a therapeutic session
     """
-    session_id: str = field(default_factory=lambda: str(uuid4()))
-    conversation_history: List[ConversationEntry] = field(default_factory=list)
+    session_id: str = field(default_factory=lambda: secrets.token_hex(16))
+    conversation_history: ConversationLog = field(default_factory=ConversationLog)
     created_at: datetime = field(default_factory=datetime.now)
     last_activity: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
     max_conversation_length: int = 20
     trim_to_length: int = 15
+    entries_added: int = 0  # Total entries ever added (not reduced by trimming)
+    last_activity_monotonic: float = field(default_factory=time.monotonic, repr=False, compare=False)
+    _info_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Accept a plain list of entries for the conversation history"""
+        if not isinstance(self.conversation_history, ConversationLog):
+            self.conversation_history = ConversationLog(self.conversation_history)
     
     def add_conversation_entry(self, role: str, content: str, metadata: Dict[str, Any] = None):
         """Add a new conversation entry"""
-        entry = ConversationEntry(
-            role=role,
-            content=content,
-            timestamp=datetime.now(),
-            metadata=metadata or {}
-        )
-        self.conversation_history.append(entry)
-        self.last_activity = datetime.now()
+        now = datetime.now()
+        self.conversation_history.append(role, content, now, metadata or {})
+        self.last_activity = now
+        self.last_activity_monotonic = time.monotonic()
+        self.entries_added += 1
+        self._info_cache = None
         
         # Trim conversation if too long
         if len(self.conversation_history) > self.max_conversation_length:
-            self.conversation_history = self.conversation_history[-self.trim_to_length:]
+            self.conversation_history.trim(self.trim_to_length)
     
     def get_conversation_context(self) -> List[Dict[str, str]]:
         """Get conversation history formatted for AI models"""
-        return [
-            {"role": entry.role, "content": entry.content}
-            for entry in self.conversation_history
-        ]
+        return self.conversation_history.to_context()
+    
+    def get_info(self) -> Dict[str, Any]:
+        """Get session summary (cached until the next conversation entry; excludes is_active)"""
+        if self._info_cache is None:
+            self._info_cache = {
+                "session_id": self.session_id,
+                "created_at": self.created_at.isoformat(),
+                "last_activity": self.last_activity.isoformat(),
+                "conversation_count": self.get_conversation_count(),
+                "user_messages": self.get_user_messages_count(),
+                "assistant_messages": self.get_assistant_messages_count(),
+                "duration": self.get_session_duration(),
+                "metadata": self.metadata
+            }
+        return self._info_cache
     
     def get_session_duration(self) -> float:
         """Get session duration in seconds"""
         return (self.last_activity - self.created_at).total_seconds()
     
-    def is_active(self, timeout_minutes: int = 30) -> bool:
-        """Check if session is still active"""
-        timeout_seconds = timeout_minutes * 60
-        return (datetime.now() - self.last_activity).total_seconds() < timeout_seconds
+    def is_active(self, timeout_minutes: int = 30, now: Optional[float] = None) -> bool:
+        """Check if session is still active (`now` is a time.monotonic() reading)"""
+        if now is None:
+            now = time.monotonic()
+        return now - self.last_activity_monotonic < timeout_minutes * 60
     
     def get_conversation_count(self) -> int:
         """Get total number of conversation entries"""
@@ -68,8 +171,8 @@ class TherapeuticSession:
     
     def get_user_messages_count(self) -> int:
         """Get number of user messages"""
-        return sum(1 for entry in self.conversation_history if entry.role == 'user')
+        return self.conversation_history.count_role('user')
     
     def get_assistant_messages_count(self) -> int:
         """Get number of assistant messages"""
-        return sum(1 for entry in self.conversation_history if entry.role == 'assistant') 
\ No newline at end of file
+        return self.conversation_history.count_role('assistant') 
\ No newline at end of file
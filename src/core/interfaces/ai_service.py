@@ -72,6 +72,17 @@ class IClaudeService(IAIModelService):
     ) -> TherapeuticResponse:
         """Generate therapeutic response using Claude"""
         pass
+    
+    @abstractmethod
+    async def generate_streaming_therapeutic_response(
+        self,
+        user_input: str,
+        conversation_history: List[Dict[str, str]],
+        session_id: str,
+        system_prompt: str
+    ) -> AsyncGenerator[str, None]:
+        """Generate streaming therapeutic response using Claude"""
+        pass
 
 
 class IAIOrchestrator(ABC):
@@ -26,6 +26,16 @@ class IAudioService(ABC):
         """Convert text to speech using parallel processing for optimal performance"""
         pass
     
+    async def text_to_speech_stream(self, text: str, max_workers: int = None) -> AsyncGenerator[bytes, None]:
+        """Convert text to speech, yielding audio in playback order as it becomes ready
+        
+        The default yields the whole text_to_speech_parallel result at once; implementations
+        that synthesize chunks in parallel can yield each chunk as soon as it is due.
+        """
+        audio_data = await self.text_to_speech_parallel(text, max_workers or 8)
+        if audio_data.audio_bytes:
+            yield audio_data.audio_bytes
+    
     @abstractmethod
     async def text_to_speech_streaming(self, text: str) -> AsyncGenerator[Dict[str, Any], None]:
         """Convert text to speech with real-time streaming using OpenAI's streaming API"""
@@ -5,7 +5,7 @@ Session Service Interfaces - Contracts for session management
 
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
-from ..entities.therapeutic_session import TherapeuticSession
+from ..entities.therapeutic_session import TherapeuticSession, ConversationEntry
 
 
 class ISessionManager(ABC):
@@ -21,11 +21,19 @@ class ISessionManager(ABC):
         """Get session by ID"""
         pass
     
+    async def get_session_async(self, session_id: str) -> Optional[TherapeuticSession]:
+        """Get session by ID from the event loop (implementations may move storage reads off it)"""
+        return self.get_session(session_id)
+    
     @abstractmethod
     def update_session(self, session: TherapeuticSession) -> bool:
         """Update session"""
         pass
     
+    async def update_session_async(self, session: TherapeuticSession) -> bool:
+        """Update session from the event loop (implementations may move storage writes off it)"""
+        return self.update_session(session)
+    
     @abstractmethod
     def delete_session(self, session_id: str) -> bool:
         """Delete session"""
@@ -52,7 +60,12 @@ class ISessionStorage(ABC):
     
     @abstractmethod
     def store_session(self, session: TherapeuticSession) -> bool:
-        """Store session"""
+        """Store a full session snapshot"""
+        pass
+    
+    @abstractmethod
+    def append_entries(self, session_id: str, entries: List[ConversationEntry]) -> bool:
+        """Append conversation entries to a stored session without rewriting it"""
         pass
     
     @abstractmethod
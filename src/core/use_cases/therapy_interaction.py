@@ -3,12 +3,13 @@
 Therapy Interaction Use Cases - Business logic for therapeutic interactions
 """
 
+import re
 import time
 import asyncio
-import re
-from typing import Dict, Optional, Any, List, AsyncGenerator
+import logging
+from functools import cached_property
+from typing import Dict, Optional, Any, List, Set, Tuple, AsyncGenerator, Iterator
 from uuid import uuid4
-from concurrent.futures import ThreadPoolExecutor
 
 from ..entities.therapeutic_session import TherapeuticSession
 from ..entities.audio_data import AudioData
@@ -17,6 +18,104 @@ from ..interfaces.ai_service import IAIOrchestrator
 from ..interfaces.audio_service import IAudioService
 from ..interfaces.session_service import ISessionManager
 
+logger = logging.getLogger(__name__)
+
+# Indonesian sentence endings
+_SENTENCE_ENDINGS = ".!?;"
+# Shorter candidates ("1.", "Dr.", "Ya.") stay attached to the following sentence
+_MIN_SENTENCE_CHARS = 15
+# Clause boundaries that may close the first TTS fragment early
+_CLAUSE_BREAKS = ",—:" + _SENTENCE_ENDINGS
+_FIRST_CHUNK_MIN_CHARS = 25
+# A sentence ending / clause break counts only when whitespace follows it
+_SENTENCE_END_RE = re.compile(f"[{re.escape(_SENTENCE_ENDINGS)}](?=\\s)")
+_CLAUSE_BREAK_RE = re.compile(f"[{re.escape(_CLAUSE_BREAKS)}](?=\\s)")
+# Short sentences arriving within this window are sent to TTS as one request
+_TTS_BATCH_WINDOW = 0.05  # seconds
+_TTS_BATCH_MAX_CHARS = 180
+# LLM deltas are forwarded to the client in batches of this size or age
+_STREAM_FLUSH_CHARS = 64
+_STREAM_FLUSH_INTERVAL = 0.05  # seconds
+
+# User-facing error copy
+_ERR_PROCESSING = "Terjadi kesalahan dalam memproses permintaan Anda: {}"
+_ERR_INAUDIBLE = "Maaf, saya tidak dapat mendengar suara Anda dengan jelas. Silakan coba lagi."
+
+
+def _error_response(session_id: Optional[str], error: Exception) -> Dict[str, Any]:
+    """Build the failure result returned by the non-streaming entry points"""
+    return {
+        "success": False,
+        "error": _ERR_PROCESSING.format(error),
+        "session_id": session_id
+    }
+
+
+class _SentenceBatcher:
+    """Coalesces short sentences that arrive close together into a single TTS request"""
+    __slots__ = ("sentences", "chars", "deadline")
+    
+    def __init__(self):
+        self.sentences: List[str] = []
+        self.chars = 0
+        self.deadline = 0.0
+    
+    def add(self, sentence: str, now: float) -> List[str]:
+        """Add a sentence; returns any texts that are ready for TTS"""
+        ready = []
+        if self.sentences and (now >= self.deadline or self.chars + len(sentence) >= _TTS_BATCH_MAX_CHARS):
+            ready.extend(self.flush())
+        if not self.sentences:
+            self.deadline = now + _TTS_BATCH_WINDOW
+        self.sentences.append(sentence)
+        self.chars += len(sentence) + 1
+        if self.chars >= _TTS_BATCH_MAX_CHARS:
+            ready.extend(self.flush())
+        return ready
+    
+    def flush_due(self, now: float) -> List[str]:
+        """Flush the batch if its window has closed"""
+        if self.sentences and now >= self.deadline:
+            return self.flush()
+        return []
+    
+    def flush(self) -> List[str]:
+        """Flush the batch as one text"""
+        if not self.sentences:
+            return []
+        text = " ".join(self.sentences)
+        self.sentences = []
+        self.chars = 0
+        return [text]
+
+
+class _AudioSequencer:
+    """Releases TTS output in chunk order while later chunks synthesize concurrently"""
+    __slots__ = ("next_id", "backlog")
+    
+    def __init__(self):
+        self.next_id = 0  # Chunk whose audio is currently streaming to the client
+        self.backlog: Dict[int, List[Any]] = {}  # Output of later chunks, held until their turn
+    
+    def push(self, chunk_id: int, item: Any) -> List[Tuple[int, Any]]:
+        """Accept one TTS output item; returns the (chunk_id, item) pairs now due for the client
+        
+        Items are audio frames, an exception, or None marking the end of a chunk.
+        """
+        if chunk_id != self.next_id:
+            self.backlog.setdefault(chunk_id, []).append(item)
+            return []
+        
+        released = [(chunk_id, item)]
+        # When the head chunk ends, everything already buffered for the next one is due
+        while released[-1][1] is None:
+            self.next_id += 1
+            items = self.backlog.pop(self.next_id, None)
+            if not items:
+                break
+            released.extend((self.next_id, queued) for queued in items)
+        return released
+
 
 class TherapyInteractionUseCase:
     """Use case for handling therapy interactions"""
@@ -26,14 +125,33 @@ class TherapyInteractionUseCase:
         ai_orchestrator: IAIOrchestrator,
         audio_service: IAudioService,
         session_manager: ISessionManager,
-        system_prompt: str
+        system_prompt: str,
+        tts_concurrency: int = 4
     ):
         self.ai_orchestrator = ai_orchestrator
         self.audio_service = audio_service
         self.session_manager = session_manager
         self.system_prompt = system_prompt
-        # Create executor for parallel TTS processing
-        self.tts_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="StreamTTS")
+        self._tts_concurrency = tts_concurrency
+        # Strong references to fire-and-forget session writes until they finish
+        self._background_updates: Set[asyncio.Task] = set()
+    
+    @cached_property
+    def _tts_sem(self) -> asyncio.Semaphore:
+        """Bound on TTS requests in flight across all streams; later chunks queue behind earlier ones
+        
+        Created on first use so it belongs to the serving event loop.
+        """
+        return asyncio.Semaphore(self._tts_concurrency)
+    
+    async def _ensure_session(self, session_id: Optional[str]) -> Tuple[str, TherapeuticSession]:
+        """Get an existing session or create one (with a fresh id if none was given)"""
+        if session_id:
+            session = await self.session_manager.get_session_async(session_id)
+            if session:
+                return session_id, session
+        session_id = session_id or uuid4().hex
+        return session_id, self.session_manager.create_session(session_id)
     
     async def process_voice_therapy(
         self,
@@ -41,16 +159,11 @@ class TherapyInteractionUseCase:
         session_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Process complete voice therapy interaction"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Get or create session
-            if not session_id:
-                session_id = str(uuid4())
-            
-            session = self.session_manager.get_session(session_id)
-            if not session:
-                session = self.session_manager.create_session(session_id)
+            session_id, session = await self._ensure_session(session_id)
             
             # Convert speech to text
             processed_audio = await self.audio_service.speech_to_text(audio_data)
@@ -58,7 +171,7 @@ class TherapyInteractionUseCase:
             if not processed_audio.transcription:
                 return {
                     "success": False,
-                    "error": "Maaf, saya tidak dapat mendengar suara Anda dengan jelas. Silakan coba lagi.",
+                    "error": _ERR_INAUDIBLE,
                     "session_id": session_id
                 }
             
@@ -66,9 +179,10 @@ class TherapyInteractionUseCase:
             session.add_conversation_entry("user", processed_audio.transcription)
             
             # Get therapeutic response
+            context = session.get_conversation_context()
             response = await self.ai_orchestrator.get_therapeutic_response(
                 processed_audio.transcription,
-                session.get_conversation_context(),
+                context,
                 session_id,
                 self.system_prompt
             )
@@ -79,11 +193,11 @@ class TherapyInteractionUseCase:
             # Convert response to speech (always use parallel processing per user preference)
             response_audio = await self.audio_service.text_to_speech(response.content)
             
-            # Update session
-            self.session_manager.update_session(session)
+            # Update session; storage writes run off the event loop
+            await self.session_manager.update_session_async(session)
             
             # Calculate latency
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
             
             return {
                 "success": True,
@@ -96,169 +210,182 @@ class TherapyInteractionUseCase:
             }
             
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Terjadi kesalahan dalam memproses permintaan Anda: {str(e)}",
-                "session_id": session_id
-            }
+            return _error_response(session_id, e)
 
     async def process_streaming_therapy(
         self,
         user_input: str,
         session_id: Optional[str] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Process streaming therapy interaction with optimized word-based chunking"""
-        start_time = time.time()
+        """Process streaming therapy interaction with sentence-based chunking"""
+        start_time = time.perf_counter()
+        tts_tasks: Set[asyncio.Task] = set()  # TTS tasks still running
+        producer: Optional[asyncio.Task] = None
+        llm_get: Optional[asyncio.Future] = None  # Pending reads of the LLM and TTS queues
+        tts_get: Optional[asyncio.Future] = None
         
         try:
             # Get or create session
-            if not session_id:
-                session_id = str(uuid4())
-            
-            session = self.session_manager.get_session(session_id)
-            if not session:
-                session = self.session_manager.create_session(session_id)
+            session_id, session = await self._ensure_session(session_id)
             
             # Add user input to session
             session.add_conversation_entry("user", user_input)
             
             # Initialize optimized streaming variables
-            word_buffer = []
-            full_response = ""
+            text_buffer = ""
+            response_parts: List[str] = []  # joined only when a frame needs the text so far
             chunk_id = 0
-            words_per_chunk = 5  # Process 5 words at a time for faster response
-            
-            print(f"🚀 Starting optimized streaming therapy for session {session_id}")
+            first_chunk_emitted = False
+            batcher = _SentenceBatcher()
+            loop = asyncio.get_running_loop()
+            
+            # TTS tasks stream (chunk_id, item) pairs here; the sequencer restores chunk order
+            tts_out: asyncio.Queue = asyncio.Queue()
+            sequencer = _AudioSequencer()
+            chunk_texts: Dict[int, str] = {}
+            pending_delta: List[str] = []  # LLM text not yet sent as a streaming_chunk
+            pending_chars = 0
+            last_flush = loop.time()
+            
+            logger.debug("🚀 Starting optimized streaming therapy for session %s", session_id)
+            
+            # Start streaming response; a producer task keeps reading the LLM while we handle TTS and yield
+            llm_chunks: asyncio.Queue = asyncio.Queue()
+            producer = asyncio.create_task(
+                self._pump_llm(user_input, session.get_conversation_context(), session_id, llm_chunks)
+            )
             
-            # Start streaming response
-            async for chunk in self.ai_orchestrator.get_streaming_therapeutic_response(
-                user_input,
-                session.get_conversation_context(),
-                session_id,
-                self.system_prompt
-            ):
-                # Add chunk to buffer and full response
-                full_response += chunk
+            # Wait on the LLM and TTS queues together, so synthesized audio goes out as soon as it
+            # is ready instead of waiting for the next LLM token
+            llm_get = asyncio.ensure_future(llm_chunks.get())
+            while True:
+                if tts_get is None:
+                    tts_get = asyncio.ensure_future(tts_out.get())
+                # An open sentence batch bounds the wait, so it goes to TTS when its window closes
+                # even if the LLM pauses
+                timeout = max(batcher.deadline - loop.time(), 0.0) if batcher.sentences else None
+                done, _ = await asyncio.wait(
+                    (llm_get, tts_get), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
                 
-                # Split chunk into words
-                words = chunk.split()
-                word_buffer.extend(words)
+                if tts_get in done:
+                    # The head chunk streams live, later ones wait their turn
+                    released = sequencer.push(*tts_get.result())
+                    tts_get = None
+                    while not tts_out.empty():
+                        released.extend(sequencer.push(*tts_out.get_nowait()))
+                    full_response = "".join(response_parts)
+                    for frame in self._audio_frames(released, chunk_texts, session_id, full_response):
+                        yield frame
                 
-                # Process words in chunks for immediate TTS
-                while len(word_buffer) >= words_per_chunk:
-                    # Get current word chunk
-                    current_words = word_buffer[:words_per_chunk]
-                    word_buffer = word_buffer[words_per_chunk:]
+                chunk = None
+                sentences = []
+                if llm_get in done:
+                    chunk = llm_get.result()
+                    if chunk is None:
+                        break
+                    llm_get = asyncio.ensure_future(llm_chunks.get())
                     
-                    # Create text from words
-                    chunk_text = " ".join(current_words)
+                    # Add chunk to buffer and full response
+                    response_parts.append(chunk)
+                    text_buffer += chunk
                     
-                    if chunk_text.strip():
-                        print(f"⚡ Processing word chunk {chunk_id}: '{chunk_text}'")
-                        
-                        # Process TTS immediately without complex async nesting
-                        try:
-                            # Start streaming TTS processing
-                            async for audio_chunk in self.audio_service.text_to_speech_streaming(chunk_text):
-                                    if audio_chunk.get("type") == "streaming_chunk":
-                                        yield {
-                                            "type": "realtime_audio_chunk",
-                                            "content": chunk_text,
-                                            "session_id": session_id,
-                                            "chunk_id": chunk_id,
-                                            "audio_chunk_id": audio_chunk.get("chunk_id", 0),
-                                            "audio_data": audio_chunk["audio_data"],
-                                            "partial": True,
-                                            "partial_response": full_response
-                                        }
-                                    elif audio_chunk.get("type") == "streaming_complete":
-                                        yield {
-                                            "type": "sentence_audio_complete",
-                                            "content": chunk_text,
-                                            "session_id": session_id,
-                                            "chunk_id": chunk_id,
-                                            "audio_data": audio_chunk["audio_data"],
-                                            "processing_time": audio_chunk.get("processing_time", 0),
-                                            "total_chunks": audio_chunk.get("total_chunks", 0),
-                                            "partial_response": full_response
-                                        }
-                                        break
-
-                        except Exception as e:
-                            print(f"❌ TTS error for chunk {chunk_id}: {e}")
-                            yield {
-                                "type": "sentence_audio_error",
-                                "content": chunk_text,
-                                "session_id": session_id,
-                                "chunk_id": chunk_id,
-                                "error": str(e),
-                                "partial_response": full_response
-                            }
-                        
-                        # Yield text chunk
-                        yield {
-                            "type": "text_chunk",
-                            "content": chunk_text,
-                            "session_id": session_id,
-                            "chunk_id": chunk_id,
-                            "partial_response": full_response
-                        }
-                        
-                        chunk_id += 1
+                    # Send each completed sentence to TTS
+                    sentences, tail = self._split_sentences(text_buffer)
+                    if not sentences and not first_chunk_emitted:
+                        # No full sentence yet: speak the first clause early to cut time to first audio
+                        fragment, tail = self._extract_first_speakable(text_buffer)
+                        if fragment:
+                            sentences = [fragment]
+                    if sentences:
+                        first_chunk_emitted = True
+                        text_buffer = text_buffer[tail:]
+                
+                # Batch short sentences that arrive together; the very first chunk skips batching
+                now = loop.time()
+                ready = batcher.flush_due(now)
+                for sentence in sentences:
+                    if chunk_id == 0 and not ready:
+                        ready.append(sentence)
+                    else:
+                        ready.extend(batcher.add(sentence, now))
+                
+                if ready:
+                    full_response = "".join(response_parts)
+                
+                debug = logger.isEnabledFor(logging.DEBUG)
+                for text in ready:
+                    if debug:
+                        logger.debug("⚡ Processing sentence chunk %d: %r", chunk_id, text)
+                    
+                    # Start TTS in the background so the LLM stream keeps flowing
+                    self._dispatch_tts(chunk_id, text, chunk_texts, tts_out, tts_tasks)
+                    
+                    # Yield text chunk
+                    yield {
+                        "type": "text_chunk",
+                        "content": text,
+                        "session_id": session_id,
+                        "chunk_id": chunk_id,
+                        "partial_response": full_response
+                    }
+                    
+                    chunk_id += 1
                 
-                # Yield streaming update
+                # Yield streaming update (coalesced deltas only; clients accumulate them)
+                if chunk is None:
+                    continue
+                pending_delta.append(chunk)
+                pending_chars += len(chunk)
+                if pending_chars >= _STREAM_FLUSH_CHARS or now - last_flush >= _STREAM_FLUSH_INTERVAL:
+                    yield {
+                        "type": "streaming_chunk",
+                        "content": "".join(pending_delta),
+                        "session_id": session_id
+                    }
+                    pending_delta.clear()
+                    pending_chars = 0
+                    last_flush = now
+            
+            # Surface any error raised while streaming from the LLM
+            await producer
+            full_response = "".join(response_parts)
+            if pending_delta:
                 yield {
                     "type": "streaming_chunk",
-                    "content": chunk,
-                    "session_id": session_id,
-                    "partial_response": full_response
+                    "content": "".join(pending_delta),
+                    "session_id": session_id
                 }
             
-            # Process remaining words in buffer
-            if word_buffer:
-                remaining_text = " ".join(word_buffer)
-                if remaining_text.strip():
-                    print(f"⚡ Processing remaining words: '{remaining_text}'")
-                    
-                    try:
-                        # Process remaining text streaming TTS
-                        async for audio_chunk in self.audio_service.text_to_speech_streaming(remaining_text):
-                                if audio_chunk.get("type") == "streaming_chunk":
-                                    yield {
-                                        "type": "realtime_audio_chunk",
-                                        "content": remaining_text,
-                                        "session_id": session_id,
-                                        "chunk_id": chunk_id,
-                                        "audio_chunk_id": audio_chunk.get("chunk_id", 0),
-                                        "audio_data": audio_chunk["audio_data"],
-                                        "partial": True,
-                                        "partial_response": full_response
-                                    }
-                                elif audio_chunk.get("type") == "streaming_complete":
-                                    yield {
-                                        "type": "sentence_audio_complete",
-                                        "content": remaining_text,
-                                        "session_id": session_id,
-                                        "chunk_id": chunk_id,
-                                        "audio_data": audio_chunk["audio_data"],
-                                        "processing_time": audio_chunk.get("processing_time", 0),
-                                        "total_chunks": audio_chunk.get("total_chunks", 0),
-                                        "partial_response": full_response
-                                    }
-                                    break
-                    except Exception as e:
-                        print(f"❌ TTS error for remaining text: {e}")
+            # Process remaining text in buffer together with any open batch
+            remaining_text = text_buffer.strip()
+            ready = batcher.add(remaining_text, loop.time()) if remaining_text else []
+            ready.extend(batcher.flush())
+            for text in ready:
+                logger.debug("⚡ Processing remaining text: %r", text)
+                
+                self._dispatch_tts(chunk_id, text, chunk_texts, tts_out, tts_tasks)
+                chunk_id += 1
+            
+            # Stream outstanding TTS output in chunk order until every chunk has ended
+            while sequencer.next_id < chunk_id:
+                if tts_get is None:
+                    tts_get = asyncio.ensure_future(tts_out.get())
+                released = sequencer.push(*(await tts_get))
+                tts_get = None
+                for frame in self._audio_frames(released, chunk_texts, session_id, full_response):
+                    yield frame
             
             # Add AI response to session
             session.add_conversation_entry("assistant", full_response)
             
-            # Update session
-            self.session_manager.update_session(session)
+            # Update session in the background so persistence doesn't delay the final frame
+            self._update_session_in_background(session)
             
             # Calculate latency
-            latency = time.time() - start_time
+            latency = time.perf_counter() - start_time
             
-            print(f"✅ Optimized streaming completed in {latency:.2f}s with {chunk_id} chunks")
+            logger.info("✅ Optimized streaming completed in %.2fs with %d chunks", latency, chunk_id)
             
             # Final yield with complete response
             yield {
@@ -271,91 +398,155 @@ class TherapyInteractionUseCase:
             }
             
         except Exception as e:
-            print(f"❌ Streaming therapy error: {e}")
+            logger.error("❌ Streaming therapy error: %s", e)
             yield {
                 "type": "error",
-                "error": f"Terjadi kesalahan dalam memproses permintaan Anda: {str(e)}",
+                "error": _ERR_PROCESSING.format(e),
                 "session_id": session_id,
                 "success": False
             }
+        finally:
+            # Client went away or the stream failed: drop work nobody will receive, and wait
+            # for the cancelled tasks so their HTTP streams are closed before we return
+            pending = list(tts_tasks)
+            pending.extend(task for task in (producer, llm_get, tts_get) if task is not None)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
-    def _extract_complete_sentences(self, text: str) -> List[str]:
-        """Extract complete sentences from text buffer"""
-        # Indonesian sentence endings
-        sentence_endings = r'[.!?;]\s+'
-        
-        # Find all complete sentences
-        sentences = re.split(sentence_endings, text)
-        
-        # Check if the text ends with a sentence ending
-        if re.search(r'[.!?;]\s*$', text):
-            # All sentences are complete
-            return [s.strip() for s in sentences if s.strip()]
-        else:
-            # Last sentence is incomplete, return all but the last
-            return [s.strip() for s in sentences[:-1] if s.strip()]
+    def _update_session_in_background(self, session: TherapeuticSession):
+        """Persist a session without awaiting it"""
+        task = asyncio.create_task(self.session_manager.update_session_async(session))
+        self._background_updates.add(task)
+        task.add_done_callback(self._background_updates.discard)
+
+    async def _pump_llm(
+        self,
+        user_input: str,
+        context: List[Dict[str, str]],
+        session_id: str,
+        llm_chunks: asyncio.Queue
+    ):
+        """Feed streamed LLM text into a queue, ending with None"""
+        try:
+            async for chunk in self.ai_orchestrator.get_streaming_therapeutic_response(
+                user_input,
+                context,
+                session_id,
+                self.system_prompt
+            ):
+                await llm_chunks.put(chunk)
+        finally:
+            llm_chunks.put_nowait(None)
 
-    def _get_remaining_text(self, text: str, processed_sentences: List[str]) -> str:
-        """Get remaining text after removing processed sentences"""
-        remaining = text
-        for sentence in processed_sentences:
-            # Remove the sentence and its ending punctuation
-            pattern = re.escape(sentence) + r'[.!?;]\s*'
-            remaining = re.sub(pattern, '', remaining, count=1)
-        return remaining
+    def _dispatch_tts(
+        self,
+        chunk_id: int,
+        text: str,
+        chunk_texts: Dict[int, str],
+        tts_out: asyncio.Queue,
+        tts_tasks: Set[asyncio.Task]
+    ):
+        """Start background TTS for a chunk, tracking the task until it finishes"""
+        chunk_texts[chunk_id] = text
+        task = asyncio.create_task(self._synthesize_chunk(chunk_id, text, tts_out))
+        tts_tasks.add(task)
+        task.add_done_callback(tts_tasks.discard)
 
-    def _process_sentence_tts(self, sentence: str, chunk_id: int) -> Dict[str, Any]:
-        """Process a single sentence through streaming TTS (synchronous for executor) - Legacy method"""
+    async def _synthesize_chunk(self, chunk_id: int, text: str, tts_out: asyncio.Queue):
+        """Stream TTS for a text chunk into `tts_out` as (chunk_id, item) pairs
+        
+        Items are audio frames as they arrive, the exception if synthesis fails, then None.
+        """
         try:
-            print(f"🎤 Processing streaming TTS for chunk {chunk_id}: '{sentence[:50]}...'")
-            
-            # Run streaming TTS processing synchronously
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                # Use streaming TTS processing for real-time audio
-                audio_chunks = []
-                complete_audio = None
-                
-                async def collect_streaming_chunks():
-                    async for chunk in self.audio_service.text_to_speech_streaming(sentence):
-                        if chunk.get("type") == "streaming_chunk":
-                            # Collect streaming chunks
-                            audio_chunks.append(chunk["audio_data"].audio_bytes)
-                        elif chunk.get("type") == "streaming_complete":
-                            # Get the complete audio data
-                            nonlocal complete_audio
-                            complete_audio = chunk["audio_data"]
-                            break
-                        elif chunk.get("type") == "streaming_error":
-                            print(f"❌ Streaming TTS error for chunk {chunk_id}: {chunk.get('error')}")
-                            raise Exception(chunk.get("error", "Unknown streaming error"))
-                
-                # Run the async function in the event loop
-                loop.run_until_complete(collect_streaming_chunks())
-                
-                # Return the complete audio data
-                return {
+            async with self._tts_sem:
+                async for audio_chunk in self.audio_service.text_to_speech_streaming(text):
+                    if audio_chunk.get("type") == "streaming_error":
+                        raise Exception(audio_chunk.get("error", "Unknown streaming error"))
+                    tts_out.put_nowait((chunk_id, audio_chunk))
+                    if audio_chunk.get("type") == "streaming_complete":
+                        break
+        except Exception as e:
+            tts_out.put_nowait((chunk_id, e))
+        finally:
+            tts_out.put_nowait((chunk_id, None))
+
+    def _audio_frames(
+        self,
+        released: List[Tuple[int, Any]],
+        chunk_texts: Dict[int, str],
+        session_id: str,
+        full_response: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Turn released TTS output into client audio frames"""
+        for chunk_id, item in released:
+            if item is None:
+                chunk_texts.pop(chunk_id, None)
+                continue
+            
+            text = chunk_texts.get(chunk_id, "")
+            if isinstance(item, Exception):
+                logger.warning("❌ TTS error for chunk %d: %s", chunk_id, item)
+                yield {
+                    "type": "sentence_audio_error",
+                    "content": text,
+                    "session_id": session_id,
                     "chunk_id": chunk_id,
-                    "audio_data": complete_audio,
-                    "sentence": sentence,
-                    "success": True,
-                    "streaming_chunks": len(audio_chunks)
+                    "error": str(item),
+                    "partial_response": full_response
                 }
-                
-            finally:
-                loop.close()
-                
-        except Exception as e:
-            print(f"❌ Streaming TTS processing failed for chunk {chunk_id}: {e}")
-            return {
-                "chunk_id": chunk_id,
-                "audio_data": None,
-                "sentence": sentence,
-                "success": False,
-                "error": str(e)
-            }
+            elif item.get("type") == "streaming_chunk":
+                yield {
+                    "type": "realtime_audio_chunk",
+                    "content": text,
+                    "session_id": session_id,
+                    "chunk_id": chunk_id,
+                    "audio_chunk_id": item.get("chunk_id", 0),
+                    "audio_data": item["audio_data"],
+                    "partial": True,
+                    "partial_response": full_response
+                }
+            elif item.get("type") == "streaming_complete":
+                yield {
+                    "type": "sentence_audio_complete",
+                    "content": text,
+                    "session_id": session_id,
+                    "chunk_id": chunk_id,
+                    "audio_data": item["audio_data"],
+                    "processing_time": item.get("processing_time", 0),
+                    "total_chunks": item.get("total_chunks", 0),
+                    "partial_response": full_response
+                }
+
+    def _split_sentences(self, text: str) -> Tuple[List[str], int]:
+        """Split complete sentences off a text buffer in a single pass
+        
+        A sentence ends at one of _SENTENCE_ENDINGS followed by whitespace, once it is at
+        least _MIN_SENTENCE_CHARS long. Returns the stripped sentences (punctuation kept) and
+        the index where the unfinished tail starts.
+        """
+        sentences = []
+        start = 0
+        for match in _SENTENCE_END_RE.finditer(text):
+            end = match.end()
+            sentence = text[start:end].strip()
+            if len(sentence) >= _MIN_SENTENCE_CHARS:
+                sentences.append(sentence)
+                start = end
+        return sentences, start
+
+    def _extract_first_speakable(self, text: str, min_chars: int = _FIRST_CHUNK_MIN_CHARS) -> Tuple[Optional[str], int]:
+        """Find the first speakable fragment of a response
+        
+        Cuts at the earliest clause break (comma, dash, colon or sentence ending) followed by
+        whitespace once at least `min_chars` are buffered. Returns the fragment and the index
+        where the rest of the buffer starts, or (None, 0) if there is no break yet.
+        """
+        match = _CLAUSE_BREAK_RE.search(text, max(min_chars - 1, 0))
+        if match is None:
+            return None, 0
+        return text[:match.end()].strip(), match.end()
 
     # Note: Streaming TTS processing is now handled directly in the main streaming loop for better performance
     
@@ -369,20 +560,16 @@ class TherapyInteractionUseCase:
         """Process text-based therapy interaction"""
         try:
             # Get or create session
-            if not session_id:
-                session_id = str(uuid4())
-            
-            session = self.session_manager.get_session(session_id)
-            if not session:
-                session = self.session_manager.create_session(session_id)
+            session_id, session = await self._ensure_session(session_id)
             
             # Add user input to session
             session.add_conversation_entry("user", user_input)
             
             # Get therapeutic response
+            context = session.get_conversation_context()
             response = await self.ai_orchestrator.get_therapeutic_response(
                 user_input,
-                session.get_conversation_context(),
+                context,
                 session_id,
                 self.system_prompt
             )
@@ -390,8 +577,8 @@ class TherapyInteractionUseCase:
             # Add AI response to session
             session.add_conversation_entry("assistant", response.content)
             
-            # Update session
-            self.session_manager.update_session(session)
+            # Update session; storage writes run off the event loop
+            await self.session_manager.update_session_async(session)
             
             return {
                 "success": True,
@@ -401,11 +588,7 @@ class TherapyInteractionUseCase:
             }
             
         except Exception as e:
-            return {
-                "success": False,
-                "error": f"Terjadi kesalahan dalam memproses permintaan Anda: {str(e)}",
-                "session_id": session_id
-            }
+            return _error_response(session_id, e)
     
     async def get_validated_response(
         self,
@@ -413,16 +596,12 @@ class TherapyInteractionUseCase:
         session_id: Optional[str] = None
     ) -> ModelValidationResponse:
         """Get validated response from multiple models"""
-        if not session_id:
-            session_id = str(uuid4())
-        
-        session = self.session_manager.get_session(session_id)
-        if not session:
-            session = self.session_manager.create_session(session_id)
+        session_id, session = await self._ensure_session(session_id)
         
+        context = session.get_conversation_context()
         return await self.ai_orchestrator.get_validated_response(
             user_input,
-            session.get_conversation_context(),
+            context,
             session_id,
             self.system_prompt
         )
@@ -449,17 +628,9 @@ class TherapyInteractionUseCase:
         if not session:
             return None
         
-        return {
-            "session_id": session.session_id,
-            "created_at": session.created_at.isoformat(),
-            "last_activity": session.last_activity.isoformat(),
-            "conversation_count": session.get_conversation_count(),
-            "user_messages": session.get_user_messages_count(),
-            "assistant_messages": session.get_assistant_messages_count(),
-            "duration": session.get_session_duration(),
-            "is_active": session.is_active(),
-            "metadata": session.metadata
-        }
+        info = dict(session.get_info())
+        info["is_active"] = session.is_active()
+        return info
     
     def delete_session(self, session_id: str) -> bool:
         """Delete a session"""
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+NLP Utilities - Keyword emotion and safety analysis shared by the AI services
+"""
+
+import hashlib
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+from ...core.entities.therapeutic_response import EmotionType, EmotionAnalysis, SafetyAssessment, AlertLevel
+
+# Safety keywords, one precompiled alternation per risk level so each level is a single scan.
+# A hit reports the first matching keyword in list order, as the per-keyword loops did.
+_HIGH_RISK_KEYWORDS = (
+    'ingin mati', 'bunuh diri', 'mengakhiri hidup', 'tidak ingin hidup lagi',
+    'suicide', 'kill myself', 'end my life', 'want to die',
+    'menyerah total', 'tak sanggup bertahan', 'lebih baik mati', 'life is pointless'
+)
+_MEDIUM_RISK_KEYWORDS = (
+    'tidak tahan lagi', 'putus asa', 'hopeless', 'tidak ada harapan',
+    'lelah hidup', 'tired of living', 'give up', 'kehilangan arah',
+    'merasa hampa', 'meaningless', 'tidak berguna', 'hidup terasa berat'
+)
+_SELF_HARM_KEYWORDS = (
+    'melukai diri', 'menyakiti diri', 'cutting', 'self harm',
+    'memotong', 'menyilet', 'hurt myself', 'mencederai tubuh'
+)
+_HIGH_RISK_RE = re.compile("|".join(map(re.escape, _HIGH_RISK_KEYWORDS)))
+_MEDIUM_RISK_RE = re.compile("|".join(map(re.escape, _MEDIUM_RISK_KEYWORDS)))
+_SELF_HARM_RE = re.compile("|".join(map(re.escape, _SELF_HARM_KEYWORDS)))
+_SAFETY_LEVELS = (
+    (_HIGH_RISK_RE, _HIGH_RISK_KEYWORDS, AlertLevel.RED),
+    (_SELF_HARM_RE, _SELF_HARM_KEYWORDS, AlertLevel.RED),
+    (_MEDIUM_RISK_RE, _MEDIUM_RISK_KEYWORDS, AlertLevel.ORANGE),
+)
+
+
+# Recent results keyed by a digest of the lowercased text, so raw user messages are not kept.
+# Only immutable values are cached; each call builds fresh result objects from them.
+_CACHE_MAX_ENTRIES = 4096
+_emotion_cache: "OrderedDict[bytes, Tuple[EmotionType, float, float]]" = OrderedDict()
+_safety_cache: "OrderedDict[bytes, Tuple[AlertLevel, Tuple[str, ...]]]" = OrderedDict()
+
+
+def _cached(cache: OrderedDict, text: str, classify: Callable[[str], Any]) -> Any:
+    """Look up or compute the classification of `text`, evicting the least recently used entry"""
+    key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+        return value
+    value = cache[key] = classify(text)
+    if len(cache) > _CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+    return value
+
+
+def _classify_emotion(text: str) -> Tuple[EmotionType, float, float]:
+    """Keyword emotion detection on lowercased text: (emotion, intensity, confidence)"""
+    # Basic emotion detection (simplified)
+    if any(word in text for word in ['sedih', 'sad', 'depress', 'terpuruk', 'down']):
+        return EmotionType.SAD, 0.7, 0.6
+    elif any(word in text for word in ['cemas', 'anxious', 'worry', 'takut', 'nervous']):
+        return EmotionType.ANXIOUS, 0.6, 0.6
+    elif any(word in text for word in ['marah', 'angry', 'kesal', 'frustrated']):
+        return EmotionType.ANGRY, 0.6, 0.6
+    elif any(word in text for word in ['bingung', 'confused', 'overwhelmed']):
+        return EmotionType.CONFUSED, 0.5, 0.5
+    else:
+        return EmotionType.NEUTRAL, 0.3, 0.4
+
+
+def _classify_safety(text: str) -> Tuple[AlertLevel, Tuple[str, ...]]:
+    """Keyword safety detection on lowercased text: (alert level, detected keywords)"""
+    # High risk and self-harm take priority over medium risk
+    for pattern, keywords, alert_level in _SAFETY_LEVELS:
+        if pattern.search(text):
+            return alert_level, (next(keyword for keyword in keywords if keyword in text),)
+    return AlertLevel.GREEN, ()
+
+
+def analyze_emotion(user_input: str) -> EmotionAnalysis:
+    """Simplified emotion analysis based on keywords"""
+    emotion, intensity, confidence = _cached(_emotion_cache, user_input.lower(), _classify_emotion)
+    return EmotionAnalysis(
+        primary_emotion=emotion,
+        intensity=intensity,
+        confidence=confidence
+    )
+
+
+def assess_safety(user_input: str) -> SafetyAssessment:
+    """Assess safety based on keywords and patterns"""
+    alert_level, keywords = _cached(_safety_cache, user_input.lower(), _classify_safety)
+    return SafetyAssessment(
+        alert_level=alert_level,
+        keywords_detected=list(keywords),
+        requires_intervention=alert_level == AlertLevel.RED,
+        requires_referral=alert_level in (AlertLevel.RED, AlertLevel.ORANGE)
+    )
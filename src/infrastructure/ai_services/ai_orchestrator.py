@@ -3,32 +3,52 @@
 AI Orchestrator - Manages multiple AI services with fallback logic
 """
 
+import asyncio
+import logging
+import httpx
+from functools import cached_property
 from typing import List, Dict, Optional, AsyncGenerator
-from ...core.interfaces.ai_service import IAIOrchestrator
+from ...core.interfaces.ai_service import IAIOrchestrator, IAIModelService
 from ...core.entities.therapeutic_response import TherapeuticResponse, ModelValidationResponse
 from .gpt_service import GPTService
 from .claude_service import ClaudeService
 from ...infrastructure.config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+# User-facing reply when no model could answer
+_ERR_GENERIC = "Maaf, saya sedang mengalami gangguan teknis. Bisakah Anda ulangi yang tadi?"
+
 
 class AIOrchestrator(IAIOrchestrator):
     """AI orchestrator that manages multiple AI services"""
     
-    def __init__(self):
-        # Initialize services
-        self.gpt_service = GPTService(settings.api_config.openai_api_key)
-        self.claude_service = ClaudeService(settings.api_config.anthropic_api_key)
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        # Both providers share one connection pool so keep-alive connections and TLS sessions are reused
+        self.gpt_service = GPTService(settings.api_config.openai_api_key, http_client=http_client)
+        self.claude_service = ClaudeService(settings.api_config.anthropic_api_key, http_client=http_client)
+        
+        self._max_validation_calls = settings.model_config.max_concurrent_validation_calls
+        self._speculative = settings.model_config.speculative_fallback
         
-        print("🧠 AI Orchestrator initialized")
+        logger.info("🧠 AI Orchestrator initialized")
         if self.gpt_service.is_available():
-            print(f"✅ GPT ({settings.model_config.primary_model}) available")
+            logger.info("✅ GPT (%s) available", settings.model_config.primary_model)
         else:
-            print("❌ GPT service not available")
+            logger.warning("❌ GPT service not available")
         
         if self.claude_service.is_available():
-            print(f"✅ Claude ({settings.model_config.fallback_model}) available")
+            logger.info("✅ Claude (%s) available", settings.model_config.fallback_model)
         else:
-            print("❌ Claude service not available")
+            logger.warning("❌ Claude service not available")
+    
+    @cached_property
+    def _rate_sem(self) -> asyncio.Semaphore:
+        """Cap on in-flight validation calls so parallel GPT + Claude requests stay within rate limits
+        
+        Created on first use so it belongs to the serving event loop.
+        """
+        return asyncio.Semaphore(self._max_validation_calls)
     
     async def get_therapeutic_response(
         self,
@@ -38,8 +58,17 @@ class AIOrchestrator(IAIOrchestrator):
         system_prompt: str
     ) -> TherapeuticResponse:
         """Get therapeutic response with fallback logic"""
+        # Optionally race both models instead of waiting for GPT to fail first
+        raced = self._speculative and self.gpt_service.is_available() and self.claude_service.is_available()
+        if raced:
+            response = await self._race_therapeutic_responses(
+                user_input, conversation_history, session_id, system_prompt
+            )
+            if response is not None:
+                return response
+        
         # Try GPT first
-        if self.gpt_service.is_available():
+        if not raced and self.gpt_service.is_available():
             try:
                 response = await self.gpt_service.generate_therapeutic_response(
                     user_input, conversation_history, session_id, system_prompt
@@ -47,40 +76,73 @@ class AIOrchestrator(IAIOrchestrator):
                 
                 # Check if GPT response was successful
                 if response.model_used != "error":
-                    print(f"✅ GPT-4.1 response generated for session {session_id}")
+                    logger.info("✅ GPT-4.1 response generated for session %s", session_id)
                     return response
                 else:
-                    print(f"⚠️ GPT-4.1 failed for session {session_id}")
+                    logger.warning("⚠️ GPT-4.1 failed for session %s", session_id)
                     
             except Exception as e:
-                print(f"⚠️ GPT-4.1 error for session {session_id}: {e}")
+                logger.warning("⚠️ GPT-4.1 error for session %s: %s", session_id, e)
         
         # Fallback to Claude
-        if self.claude_service.is_available():
+        if not raced and self.claude_service.is_available():
             try:
-                print(f"🔄 Falling back to Claude 3.5 Sonnet for session {session_id}")
+                logger.warning("🔄 Falling back to Claude 3.5 Sonnet for session %s", session_id)
                 response = await self.claude_service.generate_therapeutic_response(
                     user_input, conversation_history, session_id, system_prompt
                 )
                 
                 if response.model_used != "error":
-                    print(f"✅ Claude 3.5 Sonnet response generated for session {session_id}")
+                    logger.info("✅ Claude 3.5 Sonnet response generated for session %s", session_id)
                     return response
                 else:
-                    print(f"❌ Claude fallback also failed for session {session_id}")
+                    logger.error("❌ Claude fallback also failed for session %s", session_id)
                     
             except Exception as e:
-                print(f"❌ Claude fallback error for session {session_id}: {e}")
+                logger.error("❌ Claude fallback error for session %s: %s", session_id, e)
         
         # If both failed, return error response
-        print(f"❌ All AI services failed for session {session_id}")
+        logger.error("❌ All AI services failed for session %s", session_id)
         return TherapeuticResponse(
-            content="Maaf, saya sedang mengalami gangguan teknis. Bisakah Anda ulangi yang tadi?",
+            content=_ERR_GENERIC,
             session_id=session_id,
             user_input=user_input,
             model_used="error"
         )
 
+    async def _race_therapeutic_responses(
+        self,
+        user_input: str,
+        conversation_history: List[Dict[str, str]],
+        session_id: str,
+        system_prompt: str
+    ) -> Optional[TherapeuticResponse]:
+        """Run GPT and Claude concurrently and return the first successful response (None if both fail)"""
+        labels = {
+            asyncio.create_task(self.gpt_service.generate_therapeutic_response(
+                user_input, conversation_history, session_id, system_prompt
+            )): "GPT-4.1",
+            asyncio.create_task(self.claude_service.generate_therapeutic_response(
+                user_input, conversation_history, session_id, system_prompt
+            )): "Claude 3.5 Sonnet"
+        }
+        pending = set(labels)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result().model_used != "error":
+                        logger.info("✅ %s won speculative race for session %s", labels[task], session_id)
+                        return task.result()
+                    logger.warning("⚠️ %s failed in speculative race for session %s", labels[task], session_id)
+            return None
+        finally:
+            # Cancel the loser and wait for it, so its HTTP request is closed and its
+            # exception (or cancellation) is retrieved before returning
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*labels, return_exceptions=True)
+
     async def get_streaming_therapeutic_response(
         self,
         user_input: str,
@@ -91,41 +153,46 @@ class AIOrchestrator(IAIOrchestrator):
         """Get streaming therapeutic response with fallback logic"""
         # Try GPT first for streaming
         if self.gpt_service.is_available():
+            streamed = False
             try:
-                print(f"🔄 Starting streaming GPT-4.1 response for session {session_id}")
+                logger.info("🔄 Starting streaming GPT-4.1 response for session %s", session_id)
                 async for chunk in self.gpt_service.generate_streaming_therapeutic_response(
                     user_input, conversation_history, session_id, system_prompt
                 ):
+                    streamed = True
                     yield chunk
                 
-                print(f"✅ Streaming GPT-4.1 response completed for session {session_id}")
+                logger.info("✅ Streaming GPT-4.1 response completed for session %s", session_id)
                 return
                 
             except Exception as e:
-                print(f"⚠️ Streaming GPT-4.1 error for session {session_id}: {e}")
+                logger.warning("⚠️ Streaming GPT-4.1 error for session %s: %s", session_id, e)
+                # A second model's reply can't be spliced onto a partial one; end with what was sent
+                if streamed:
+                    return
         
-        # Fallback to Claude (non-streaming for now)
+        # Fallback to Claude, streamed as well
         if self.claude_service.is_available():
+            streamed = False
             try:
-                print(f"🔄 Falling back to Claude 3.5 Sonnet (non-streaming) for session {session_id}")
-                response = await self.claude_service.generate_therapeutic_response(
+                logger.warning("🔄 Falling back to streaming Claude 3.5 Sonnet for session %s", session_id)
+                async for chunk in self.claude_service.generate_streaming_therapeutic_response(
                     user_input, conversation_history, session_id, system_prompt
-                )
+                ):
+                    streamed = True
+                    yield chunk
                 
-                if response.model_used != "error":
-                    print(f"✅ Claude 3.5 Sonnet response generated for session {session_id}")
-                    yield response.content
-                else:
-                    print(f"❌ Claude fallback also failed for session {session_id}")
-                    yield "Maaf, saya sedang mengalami gangguan teknis. Bisakah Anda ulangi yang tadi?"
+                logger.info("✅ Streaming Claude 3.5 Sonnet response completed for session %s", session_id)
                     
             except Exception as e:
-                print(f"❌ Claude fallback error for session {session_id}: {e}")
-                yield "Maaf, saya sedang mengalami gangguan teknis. Bisakah Anda ulangi yang tadi?"
+                logger.error("❌ Claude fallback error for session %s: %s", session_id, e)
+                # Text already sent can't be taken back; only answer with the apology if nothing was
+                if not streamed:
+                    yield _ERR_GENERIC
         else:
             # If both failed, return error response
-            print(f"❌ All AI services failed for session {session_id}")
-            yield "Maaf, saya sedang mengalami gangguan teknis. Bisakah Anda ulangi yang tadi?"
+            logger.error("❌ All AI services failed for session %s", session_id)
+            yield _ERR_GENERIC
     
     async def get_validated_response(
         self,
@@ -134,27 +201,18 @@ class AIOrchestrator(IAIOrchestrator):
         session_id: str,
         system_prompt: str
     ) -> ModelValidationResponse:
-        """Get validated response from both models"""
-        gpt_response = None
-        claude_response = None
-        
-        # Try GPT
-        if self.gpt_service.is_available():
-            try:
-                gpt_response = await self.gpt_service.generate_therapeutic_response(
-                    user_input, conversation_history, session_id, system_prompt
-                )
-            except Exception as e:
-                print(f"Error getting GPT response: {e}")
-        
-        # Try Claude
-        if self.claude_service.is_available():
-            try:
-                claude_response = await self.claude_service.generate_therapeutic_response(
-                    user_input, conversation_history, session_id, system_prompt
-                )
-            except Exception as e:
-                print(f"Error getting Claude response: {e}")
+        """Get validated response from both models (queried concurrently)"""
+        gpt_result, claude_result = await asyncio.gather(
+            self._generate_with_limit(
+                self.gpt_service, user_input, conversation_history, session_id, system_prompt
+            ),
+            self._generate_with_limit(
+                self.claude_service, user_input, conversation_history, session_id, system_prompt
+            ),
+            return_exceptions=True
+        )
+        gpt_response = self._response_or_none(gpt_result, "GPT")
+        claude_response = self._response_or_none(claude_result, "Claude")
         
         # Determine primary response
         primary_response = None
@@ -170,6 +228,30 @@ class AIOrchestrator(IAIOrchestrator):
             consensus_reached=self._check_consensus(gpt_response, claude_response)
         )
     
+    async def _generate_with_limit(
+        self,
+        service: IAIModelService,
+        user_input: str,
+        conversation_history: List[Dict[str, str]],
+        session_id: str,
+        system_prompt: str
+    ) -> Optional[TherapeuticResponse]:
+        """Generate a response under the shared rate-limit semaphore"""
+        if not service.is_available():
+            return None
+        
+        async with self._rate_sem:
+            return await service.generate_therapeutic_response(
+                user_input, conversation_history, session_id, system_prompt
+            )
+    
+    def _response_or_none(self, result, label: str) -> Optional[TherapeuticResponse]:
+        """Normalize a gather(return_exceptions=True) result to a response or None"""
+        if isinstance(result, BaseException):
+            logger.error("Error getting %s response: %s", label, result)
+            return None
+        return result
+    
     def _check_consensus(self, gpt_response: TherapeuticResponse, claude_response: TherapeuticResponse) -> bool:
         """Check if both models reached consensus"""
         if not gpt_response or not claude_response:
@@ -181,6 +263,8 @@ class AIOrchestrator(IAIOrchestrator):
         # Simple consensus check based on response length similarity
         gpt_length = len(gpt_response.content.split())
         claude_length = len(claude_response.content.split())
+        if not gpt_length or not claude_length:
+            return gpt_length == claude_length
         
         # Consider consensus if responses are within 50% length difference
         length_ratio = min(gpt_length, claude_length) / max(gpt_length, claude_length)
@@ -193,4 +277,4 @@ class AIOrchestrator(IAIOrchestrator):
             "claude_available": self.claude_service.is_available(),
             "gpt_model": self.gpt_service.get_model_name(),
             "claude_model": self.claude_service.get_model_name()
-        } 
\ No newline at end of file
+        } 
@@ -4,30 +4,49 @@ Claude Service Implementation - Anthropic API integration for therapeutic respon
 """
 
 import time
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Tuple, AsyncGenerator
+import httpx
 from ...core.interfaces.ai_service import IClaudeService
-from ...core.entities.therapeutic_response import TherapeuticResponse, EmotionType, EmotionAnalysis, SafetyAssessment, AlertLevel
+from ...core.entities.therapeutic_response import TherapeuticResponse
 from ...infrastructure.config.settings import settings
+from ._nlp_utils import analyze_emotion, assess_safety
 
 # Handle Anthropic import gracefully
 try:
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic
 except ImportError:
-    Anthropic = None
+    AsyncAnthropic = None
+
+# Cache breakpoint marker for Anthropic prompt caching
+_EPHEMERAL_CACHE = {"type": "ephemeral"}
 
 
 class ClaudeService(IClaudeService):
     """Claude service implementation using Anthropic API"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Optional[httpx.AsyncClient] = None):
         self.api_key = api_key
         self.client = None
         self.model_name = settings.model_config.fallback_model
         self.available = False
+        # Request parameters shared by every call; only the system prompt and messages vary
+        self._base_kwargs = MappingProxyType({
+            "model": self.model_name,
+            "max_tokens": settings.model_config.max_tokens,
+            "temperature": settings.model_config.temperature
+        })
         
-        if Anthropic is not None and api_key:
+        if AsyncAnthropic is not None and api_key:
             try:
-                self.client = Anthropic(api_key=api_key)
+                api_config = settings.api_config
+                # The SDK applies its own per-request timeout (overriding the pool's), so pass ours explicitly
+                self.client = AsyncAnthropic(
+                    api_key=api_key,
+                    http_client=http_client,
+                    max_retries=settings.model_config.max_retries,
+                    timeout=httpx.Timeout(api_config.request_timeout, connect=api_config.connect_timeout)
+                )
                 self.available = True
                 print("🤖 Claude 3.5 Sonnet initialized as fallback model")
             except Exception as e:
@@ -43,7 +62,7 @@ class ClaudeService(IClaudeService):
         system_prompt: str
     ) -> TherapeuticResponse:
         """Generate therapeutic response using Claude"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         if not self.available or not self.client:
             return TherapeuticResponse(
@@ -51,36 +70,27 @@ class ClaudeService(IClaudeService):
                 session_id=session_id,
                 user_input=user_input,
                 model_used="error",
-                processing_time=time.time() - start_time
+                processing_time=time.perf_counter() - start_time
             )
         
         try:
-            # Convert OpenAI format to Claude format
-            claude_messages = []
-            for msg in conversation_history:
-                if msg["role"] in ["user", "assistant"]:
-                    claude_messages.append({
-                        "role": msg["role"],
-                        "content": msg["content"]
-                    })
+            system, claude_messages = self._build_request(conversation_history, system_prompt)
             
             # Make API call to Claude
-            response = self.client.messages.create(
-                model=self.model_name,
-                max_tokens=settings.model_config.max_tokens,
-                temperature=settings.model_config.temperature,
-                system=system_prompt,
-                messages=claude_messages
+            response = await self.client.messages.create(
+                system=system,
+                messages=claude_messages,
+                **self._base_kwargs
             )
             
             ai_response = response.content[0].text.strip()
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Create basic emotion analysis (simplified implementation)
-            emotion_analysis = self._analyze_emotion(user_input)
+            emotion_analysis = analyze_emotion(user_input)
             
             # Create safety assessment
-            safety_assessment = self._assess_safety(user_input, ai_response)
+            safety_assessment = assess_safety(user_input)
             
             return TherapeuticResponse(
                 content=ai_response,
@@ -99,109 +109,53 @@ class ClaudeService(IClaudeService):
                 session_id=session_id,
                 user_input=user_input,
                 model_used="error",
-                processing_time=time.time() - start_time
+                processing_time=time.perf_counter() - start_time
             )
     
-    def _analyze_emotion(self, user_input: str) -> EmotionAnalysis:
-        """Simplified emotion analysis based on keywords"""
-        # Convert to lowercase for analysis
-        text = user_input.lower()
+    async def generate_streaming_therapeutic_response(
+        self,
+        user_input: str,
+        conversation_history: List[Dict[str, str]],
+        session_id: str,
+        system_prompt: str
+    ) -> AsyncGenerator[str, None]:
+        """Generate streaming therapeutic response using Claude (errors propagate to the caller)"""
+        if not self.available or not self.client:
+            raise RuntimeError("Claude service not available")
         
-        # Basic emotion detection (simplified)
-        if any(word in text for word in ['sedih', 'sad', 'depress', 'terpuruk', 'down']):
-            return EmotionAnalysis(
-                primary_emotion=EmotionType.SAD,
-                intensity=0.7,
-                confidence=0.6
-            )
-        elif any(word in text for word in ['cemas', 'anxious', 'worry', 'takut', 'nervous']):
-            return EmotionAnalysis(
-                primary_emotion=EmotionType.ANXIOUS,
-                intensity=0.6,
-                confidence=0.6
-            )
-        elif any(word in text for word in ['marah', 'angry', 'kesal', 'frustrated']):
-            return EmotionAnalysis(
-                primary_emotion=EmotionType.ANGRY,
-                intensity=0.6,
-                confidence=0.6
-            )
-        elif any(word in text for word in ['bingung', 'confused', 'overwhelmed']):
-            return EmotionAnalysis(
-                primary_emotion=EmotionType.CONFUSED,
-                intensity=0.5,
-                confidence=0.5
-            )
-        else:
-            return EmotionAnalysis(
-                primary_emotion=EmotionType.NEUTRAL,
-                intensity=0.3,
-                confidence=0.4
-            )
+        system, claude_messages = self._build_request(conversation_history, system_prompt)
+        async with self.client.messages.stream(
+            system=system,
+            messages=claude_messages,
+            **self._base_kwargs
+        ) as stream:
+            async for text in stream.text_stream:
+                if text:
+                    yield text
     
-    def _assess_safety(self, user_input: str, ai_response: str) -> SafetyAssessment:
-        """Assess safety based on keywords and patterns"""
-        text = user_input.lower()
-        
-        # High risk patterns
-        high_risk_keywords = [
-            'ingin mati', 'bunuh diri', 'mengakhiri hidup', 'tidak ingin hidup lagi',
-            'suicide', 'kill myself', 'end my life', 'want to die',
-            'menyerah total', 'tak sanggup bertahan', 'lebih baik mati', 'life is pointless'
-        ]
-        
-        # Medium risk patterns
-        medium_risk_keywords = [
-            'tidak tahan lagi', 'putus asa', 'hopeless', 'tidak ada harapan',
-            'lelah hidup', 'tired of living', 'give up', 'kehilangan arah',
-            'merasa hampa', 'meaningless', 'tidak berguna', 'hidup terasa berat'
-        ]
-        
-        # Self-harm patterns
-        self_harm_keywords = [
-            'melukai diri', 'menyakiti diri', 'cutting', 'self harm',
-            'memotong', 'menyilet', 'hurt myself', 'mencederai tubuh'
-        ]
-        
-        detected_keywords = []
-        alert_level = AlertLevel.GREEN
-        requires_intervention = False
-        requires_referral = False
-        
-        # Check for high risk
-        for keyword in high_risk_keywords:
-            if keyword in text:
-                detected_keywords.append(keyword)
-                alert_level = AlertLevel.RED
-                requires_intervention = True
-                requires_referral = True
-                break
-        
-        # Check for self-harm if not already high risk
-        if alert_level != AlertLevel.RED:
-            for keyword in self_harm_keywords:
-                if keyword in text:
-                    detected_keywords.append(keyword)
-                    alert_level = AlertLevel.RED
-                    requires_intervention = True
-                    requires_referral = True
-                    break
-        
-        # Check for medium risk if not already high risk
-        if alert_level == AlertLevel.GREEN:
-            for keyword in medium_risk_keywords:
-                if keyword in text:
-                    detected_keywords.append(keyword)
-                    alert_level = AlertLevel.ORANGE
-                    requires_referral = True
-                    break
+    def _build_request(
+        self,
+        conversation_history: List[Dict[str, str]],
+        system_prompt: str
+    ) -> Tuple[Any, List[Dict[str, Any]]]:
+        """Convert OpenAI-format history into Claude's system prompt and messages"""
+        # History dicts are shared with the session's cached context: reuse them, never mutate them
+        claude_messages = [msg for msg in conversation_history if msg["role"] in ("user", "assistant")]
         
-        return SafetyAssessment(
-            alert_level=alert_level,
-            keywords_detected=detected_keywords,
-            requires_intervention=requires_intervention,
-            requires_referral=requires_referral
-        )
+        # History is resent every turn (the API is stateless); mark the system prompt and the
+        # newest turn as cache breakpoints so next turn's prefix is read from the prompt cache
+        system = system_prompt
+        if settings.model_config.enable_prompt_caching:
+            system = [{"type": "text", "text": system_prompt, "cache_control": _EPHEMERAL_CACHE}]
+            if claude_messages:
+                last_message = claude_messages[-1]
+                claude_messages[-1] = {
+                    "role": last_message["role"],
+                    "content": [
+                        {"type": "text", "text": last_message["content"], "cache_control": _EPHEMERAL_CACHE}
+                    ]
+                }
+        return system, claude_messages
     
     def is_available(self) -> bool:
         """Check if Claude service is available"""
@@ -5,20 +5,39 @@ GPT Service Implementation - OpenAI API integration for therapeutic responses
 
 import time
 import asyncio
+from types import MappingProxyType
 from typing import List, Dict, Optional, AsyncGenerator
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI
 from ...core.interfaces.ai_service import IGPTService
-from ...core.entities.therapeutic_response import TherapeuticResponse, EmotionType, EmotionAnalysis, SafetyAssessment, AlertLevel
+from ...core.entities.therapeutic_response import TherapeuticResponse
 from ...infrastructure.config.settings import settings
+from ._nlp_utils import analyze_emotion, assess_safety
 
 
 class GPTService(IGPTService):
     """GPT service implementation using OpenAI API"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Optional[httpx.AsyncClient] = None):
         self.api_key = api_key
-        self.client = OpenAI(api_key=api_key)
-        self.model_name = settings.model_config.primary_model
+        model_config = settings.model_config
+        api_config = settings.api_config
+        # The SDK applies its own per-request timeout (overriding the pool's), so pass ours explicitly
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=http_client,
+            max_retries=model_config.max_retries,
+            timeout=httpx.Timeout(api_config.request_timeout, connect=api_config.connect_timeout)
+        )
+        self.model_name = model_config.primary_model
+        # Request parameters shared by every completion call; only the messages vary
+        self._base_kwargs = MappingProxyType({
+            "model": self.model_name,
+            "max_tokens": model_config.max_tokens,
+            "temperature": model_config.temperature,
+            "presence_penalty": model_config.presence_penalty,
+            "frequency_penalty": model_config.frequency_penalty
+        })
         
     async def generate_therapeutic_response(
         self,
@@ -28,31 +47,23 @@ class GPTService(IGPTService):
         system_prompt: str
     ) -> TherapeuticResponse:
         """Generate therapeutic response using GPT"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Prepare messages with system prompt
-            messages = [{"role": "system", "content": system_prompt}]
-            messages.extend(conversation_history)
+            messages = [{"role": "system", "content": system_prompt}, *conversation_history]
             
             # Make API call with original hyperparameters
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                max_tokens=settings.model_config.max_tokens,
-                temperature=settings.model_config.temperature,
-                presence_penalty=settings.model_config.presence_penalty,
-                frequency_penalty=settings.model_config.frequency_penalty
-            )
+            response = await self.client.chat.completions.create(messages=messages, **self._base_kwargs)
             
             ai_response = response.choices[0].message.content.strip()
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Create basic emotion analysis (simplified implementation)
-            emotion_analysis = self._analyze_emotion(user_input)
+            emotion_analysis = analyze_emotion(user_input)
             
             # Create safety assessment
-            safety_assessment = self._assess_safety(user_input, ai_response)
+            safety_assessment = assess_safety(user_input)
             
             return TherapeuticResponse(
                 content=ai_response,
@@ -71,7 +82,7 @@ class GPTService(IGPTService):
                 session_id=session_id,
                 user_input=user_input,
                 model_used="error",
-                processing_time=time.time() - start_time
+                processing_time=time.perf_counter() - start_time
             )
 
     async def generate_streaming_therapeutic_response(
@@ -84,19 +95,14 @@ class GPTService(IGPTService):
         """Generate optimized streaming therapeutic response using GPT with timeout"""
         try:
             # Prepare messages with system prompt
-            messages = [{"role": "system", "content": system_prompt}]
-            messages.extend(conversation_history)
+            messages = [{"role": "system", "content": system_prompt}, *conversation_history]
             
             print(f"🚀 Starting optimized streaming GPT response for session {session_id}")
             
             # Make streaming API call with optimized hyperparameters
-            response_stream = self.client.chat.completions.create(
-                model=self.model_name,
+            response_stream = await self.client.chat.completions.create(
                 messages=messages,
-                max_tokens=settings.model_config.max_tokens,  # Optimized to 256 tokens
-                temperature=settings.model_config.temperature,
-                presence_penalty=settings.model_config.presence_penalty,
-                frequency_penalty=settings.model_config.frequency_penalty,
+                **self._base_kwargs,
                 stream=True,
                 # Add streaming optimization
                 stream_options={"include_usage": False}  # Exclude usage stats for faster streaming
@@ -104,21 +110,20 @@ class GPTService(IGPTService):
             
             # Track response timing
             chunk_count = 0
-            start_time = time.time()
+            start_time = time.perf_counter()
             first_chunk_time = None
             
             # Stream the response chunks with optimized processing
-            for chunk in response_stream:
+            async for chunk in response_stream:
                 if chunk.choices[0].delta.content is not None:
                     content = chunk.choices[0].delta.content
                     
                     # Track first chunk timing
                     if first_chunk_time is None:
-                        first_chunk_time = time.time()
+                        first_chunk_time = time.perf_counter()
                         print(f"⚡ First chunk received in {first_chunk_time - start_time:.3f}s")
                     
                     chunk_count += 1
-                    print(f"📤 Fast streaming chunk {chunk_count}: '{content}'")
                     yield content
                     
                     # Optional: Add micro-delay to prevent overwhelming
@@ -128,108 +133,7 @@ class GPTService(IGPTService):
             
         except Exception as e:
             print(f"❌ Error in optimized streaming GPT response generation: {e}")
-            yield "Maaf, saya sedang mengalami gangguan teknis. Bisakah Anda ulangi yang tadi?"
-    
-    def _analyze_emotion(self, user_input: str) -> EmotionAnalysis:
-        """Simplified emotion analysis based on keywords"""
-        # Convert to lowercase for analysis
-        text = user_input.lower()
-        
-        # Basic emotion detection (simplified)
-        if any(word in text for word in ['sedih', 'sad', 'depress', 'terpuruk', 'down']):
-            return EmotionAnalysis(
-                primary_emotion=EmotionType.SAD,
-                intensity=0.7,
-                confidence=0.6
-            )
-        elif any(word in text for word in ['cemas', 'anxious', 'worry', 'takut', 'nervous']):
-            return EmotionAnalysis(
-                primary_emotion=EmotionType.ANXIOUS,
-                intensity=0.6,
-                confidence=0.6
-            )
-        elif any(word in text for word in ['marah', 'angry', 'kesal', 'frustrated']):
-            return EmotionAnalysis(
-                primary_emotion=EmotionType.ANGRY,
-                intensity=0.6,
-                confidence=0.6
-            )
-        elif any(word in text for word in ['bingung', 'confused', 'overwhelmed']):
-            return EmotionAnalysis(
-                primary_emotion=EmotionType.CONFUSED,
-                intensity=0.5,
-                confidence=0.5
-            )
-        else:
-            return EmotionAnalysis(
-                primary_emotion=EmotionType.NEUTRAL,
-                intensity=0.3,
-                confidence=0.4
-            )
-    
-    def _assess_safety(self, user_input: str, ai_response: str) -> SafetyAssessment:
-        """Assess safety based on keywords and patterns"""
-        text = user_input.lower()
-        
-        # High risk patterns
-        high_risk_keywords = [
-            'ingin mati', 'bunuh diri', 'mengakhiri hidup', 'tidak ingin hidup lagi',
-            'suicide', 'kill myself', 'end my life', 'want to die',
-            'menyerah total', 'tak sanggup bertahan', 'lebih baik mati', 'life is pointless'
-        ]
-        
-        # Medium risk patterns
-        medium_risk_keywords = [
-            'tidak tahan lagi', 'putus asa', 'hopeless', 'tidak ada harapan',
-            'lelah hidup', 'tired of living', 'give up', 'kehilangan arah',
-            'merasa hampa', 'meaningless', 'tidak berguna', 'hidup terasa berat'
-        ]
-        
-        # Self-harm patterns
-        self_harm_keywords = [
-            'melukai diri', 'menyakiti diri', 'cutting', 'self harm',
-            'memotong', 'menyilet', 'hurt myself', 'mencederai tubuh'
-        ]
-        
-        detected_keywords = []
-        alert_level = AlertLevel.GREEN
-        requires_intervention = False
-        requires_referral = False
-        
-        # Check for high risk
-        for keyword in high_risk_keywords:
-            if keyword in text:
-                detected_keywords.append(keyword)
-                alert_level = AlertLevel.RED
-                requires_intervention = True
-                requires_referral = True
-                break
-        
-        # Check for self-harm if not already high risk
-        if alert_level != AlertLevel.RED:
-            for keyword in self_harm_keywords:
-                if keyword in text:
-                    detected_keywords.append(keyword)
-                    alert_level = AlertLevel.RED
-                    requires_intervention = True
-                    requires_referral = True
-                    break
-        
-        # Check for medium risk if not already high risk
-        if alert_level == AlertLevel.GREEN:
-            for keyword in medium_risk_keywords:
-                if keyword in text:
-                    detected_keywords.append(keyword)
-                    alert_level = AlertLevel.ORANGE
-                    requires_referral = True
-                    break
-        
-        return SafetyAssessment(
-            alert_level=alert_level,
-            keywords_detected=detected_keywords,
-            requires_intervention=requires_intervention,
-            requires_referral=requires_referral
-        )
+            raise
     
     def is_available(self) -> bool:
         """Check if GPT service is available"""
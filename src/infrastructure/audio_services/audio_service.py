@@ -4,80 +4,154 @@ Audio Service Implementation - Ultra-fast simplified TTS processing
 """
 
 import io
-import os
+import logging
+import re
+import hashlib
+import random
+import struct
 import asyncio
 import time
-import threading
 import tempfile
 import math
+from collections import OrderedDict
+from contextlib import aclosing
+from dataclasses import dataclass, asdict
+from types import MappingProxyType
 from typing import List, Tuple, Dict, Any, Optional, Union, AsyncGenerator
-import concurrent.futures
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, APIConnectionError, APIStatusError
 from ...core.interfaces.audio_service import IAudioService
 from ...core.entities.audio_data import AudioData, ProcessedAudioData
 from ...infrastructure.config.settings import settings
 
+# Per-chunk TTS/STT timings are logged at DEBUG; enable them with LOG_LEVEL=DEBUG or by setting
+# the "src.infrastructure.audio_services.audio_service" logger to DEBUG
+logger = logging.getLogger(__name__)
+
 try:
     import pydub
     from pydub import AudioSegment
     PYDUB_AVAILABLE = True
 except ImportError:
     PYDUB_AVAILABLE = False
-    print("⚠️ pydub not available - audio preprocessing disabled")
+    logger.warning("⚠️ pydub not available - audio preprocessing disabled")
     # Create a dummy AudioSegment class for type hints
     class AudioSegment:
         pass
 
+# Sentence boundary: whitespace following terminal punctuation
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# Upper bound on parallel TTS requests for one text
+_MAX_TTS_CHUNKS = 20
+# Request parameters for every parallel TTS chunk; only the input text varies
+_CHUNK_TTS_PARAMS = MappingProxyType({
+    "model": "gpt-4o-mini-tts",
+    "voice": "alloy",
+    "response_format": "wav",
+    "speed": 1.0  # Normal speed for clarity
+})
+
+
+def _parse_wav(data: bytes) -> Optional[Tuple[bytes, bytes]]:
+    """Split a RIFF/WAVE file into its fmt chunk body and sample data (None if it isn't one)"""
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        size = int.from_bytes(data[offset + 4:offset + 8], "little")
+        body_start = offset + 8
+        if chunk_id == b"data":
+            # Streamed WAVs may carry a placeholder data size; the slice stops at the end of the file
+            return (fmt, data[body_start:body_start + size]) if fmt is not None else None
+        if chunk_id == b"fmt ":
+            fmt = data[body_start:body_start + size]
+        offset = body_start + size + (size & 1)
+    return None
+
+
+def _wav_duration(data: bytes) -> float:
+    """Playback length of a WAV file in seconds from its fmt byte rate (0.0 if it can't be parsed)"""
+    parsed = _parse_wav(data)
+    if parsed is None or len(parsed[0]) < 12:
+        return 0.0
+    fmt, samples = parsed
+    byte_rate = int.from_bytes(fmt[8:12], "little")
+    return len(samples) / byte_rate if byte_rate else 0.0
+
+
+def _build_wav(fmt: bytes, sample_parts: List[bytes]) -> bytes:
+    """Build one WAV file from a fmt chunk body and the concatenated sample data"""
+    data_size = sum(len(part) for part in sample_parts)
+    header = b"".join((
+        b"RIFF", struct.pack("<I", 4 + 8 + len(fmt) + 8 + data_size), b"WAVE",
+        b"fmt ", struct.pack("<I", len(fmt)), fmt,
+        b"data", struct.pack("<I", data_size)
+    ))
+    return b"".join([header, *sample_parts])
+
+
+@dataclass(slots=True)
+class AudioPerformanceStats:
+    """Running TTS/STT counters; derived ratios are computed in get_performance_stats"""
+    total_tts_calls: int = 0
+    total_stt_calls: int = 0
+    total_processing_time: float = 0.0
+    average_processing_time: float = 0.0
+    parallel_calls_made: int = 0
+    successful_chunks: int = 0
+    failed_chunks: int = 0
+    fastest_chunk_time: float = float('inf')
+    slowest_chunk_time: float = 0.0
+    stt_chunks_processed: int = 0
+    stt_parallel_calls: int = 0
+    stt_preprocessing_time: float = 0.0
+    stt_compression_time: float = 0.0
+    stt_ultra_fast_chunks: int = 0  # Chunks processed under 1 second
+    stt_fastest_chunk: float = float('inf')
+    stt_network_time: float = 0.0
+
 
 class AudioService(IAudioService):
     """Simplified audio service implementation with ultra-fast TTS processing"""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Optional[httpx.AsyncClient] = None):
         self.api_key = api_key
-        self.client = OpenAI(api_key=api_key)
+        # One async client for every TTS/STT call; concurrency comes from the event loop and httpx's pool
+        self.client = AsyncOpenAI(api_key=api_key, http_client=http_client)
         
-        # Optimized executors for ultra-fast processing
-        self.max_workers = min(32, (os.cpu_count() or 1) * 4)  # Base worker count
-        self.tts_executor = ThreadPoolExecutor(
-            max_workers=min(48, self.max_workers * 2),  # More workers for TTS
-            thread_name_prefix="OptimizedTTS"
-        )
-        # Dedicated STT executor for ultra-fast speech processing
-        self.stt_max_workers = min(64, (os.cpu_count() or 1) * 8)  # More workers for STT
-        self.stt_executor = ThreadPoolExecutor(
-            max_workers=self.stt_max_workers,
-            thread_name_prefix="OptimizedSTT"
-        )
+        # Audio settings are read once here instead of on every TTS call and chunk
+        audio_config = settings.audio_config
+        self._default_format = audio_config.default_format
+        self._max_chunk_size = audio_config.max_chunk_size
+        self._min_split_size = audio_config.min_split_size
+        self._max_parallel_tts = audio_config.max_workers
+        self._streaming_buffer_size = audio_config.streaming_buffer_size
+        self._tts_timeout = audio_config.tts_timeout
+        self._tts_retries = audio_config.tts_retries
+        self._tts_retry_backoff = audio_config.tts_retry_backoff
+        # Chunk requests retry in _create_chunk_speech with a backoff short enough for the TTS
+        # timeout budget, so the SDK's own (much slower) retry loop is disabled for them
+        self._chunk_client = self.client.with_options(max_retries=0)
+        
+        # LRU of synthesized audio (chunk, full-text and streamed-sentence entries), evicted
+        # oldest-first past the byte budget
+        self._tts_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._tts_cache_bytes = 0
+        self._tts_cache_max_bytes = audio_config.tts_cache_max_bytes
         
         # Enhanced performance tracking for ultra-fast processing
-        self.performance_stats = {
-            "total_tts_calls": 0,
-            "total_stt_calls": 0,
-            "total_processing_time": 0.0,
-            "average_processing_time": 0.0,
-            "parallel_calls_made": 0,
-            "successful_chunks": 0,
-            "failed_chunks": 0,
-            "fastest_chunk_time": float('inf'),
-            "slowest_chunk_time": 0.0,
-            "stt_chunks_processed": 0,
-            "stt_parallel_calls": 0,
-            "stt_preprocessing_time": 0.0,
-            "stt_compression_time": 0.0,
-            "stt_ultra_fast_chunks": 0,  # Chunks processed under 1 second
-            "stt_fastest_chunk": float('inf'),
-            "stt_network_time": 0.0
-        }
+        self.performance_stats = AudioPerformanceStats()
         
-        # Thread-safe lock for stats
-        self._stats_lock = threading.Lock()
+        # Plain counters: every update runs on the event loop thread, so no lock is needed.
+        # Averages are derived in get_performance_stats rather than on every call.
         
-        print(f"⚡ ULTRA-FAST STT initialized with {self.stt_max_workers} STT workers + {self.max_workers} TTS workers")
+        logger.info("⚡ ULTRA-FAST audio service initialized (async TTS/STT, up to %s parallel TTS chunks)", self._max_parallel_tts)
         
     async def speech_to_text(self, audio_data: AudioData) -> ProcessedAudioData:
         """Convert speech to text using optimized parallel Whisper processing"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Quick check for empty audio
@@ -86,7 +160,7 @@ class AudioService(IAudioService):
                 audio_id=audio_data.audio_id,
                 transcription="",
                 confidence=0.0,
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 language="auto"
             )
             # Detect audio duration and apply optimization strategy
@@ -103,12 +177,12 @@ class AudioService(IAudioService):
                 return await self._process_audio_ultra_fast(audio_data, start_time, chunk_seconds=8)
             
         except Exception as e:
-            print(f"❌ Error in speech-to-text: {e}")
+            logger.error("❌ Error in speech-to-text: %s", e)
             return ProcessedAudioData(
                 audio_id=audio_data.audio_id,
                 transcription="",
                 confidence=0.0,
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 language="auto"
             )
     
@@ -124,7 +198,7 @@ class AudioService(IAudioService):
             audio_segment = AudioSegment.from_file(io.BytesIO(audio_bytes), format=format)
             return len(audio_segment) / 1000.0  # Convert ms to seconds
         except Exception as e:
-            print(f"⚠️ Could not determine audio duration: {e}")
+            logger.warning("⚠️ Could not determine audio duration: %s", e)
             # Conservative fallback
             return len(audio_bytes) / 32000
     
@@ -139,8 +213,8 @@ class AudioService(IAudioService):
             audio_file.name = f"temp_audio.{audio_data.format}"
             
             # Direct transcription with auto-detection for mixed Arabic-English
-            network_start = time.time()
-            transcript = self.client.audio.transcriptions.create(
+            network_start = time.perf_counter()
+            transcript = await self.client.audio.transcriptions.create(
                 model="whisper-1",
                 file=audio_file,
                 language="en",
@@ -148,29 +222,24 @@ class AudioService(IAudioService):
                 # No language parameter - enables auto-detection for mixed Arabic-English
                 # Whisper excels at handling code-switched languages naturally
             )
-            network_time = time.time() - network_start
+            network_time = time.perf_counter() - network_start
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
-            with self._stats_lock:
-                self.performance_stats["total_stt_calls"] += 1
-                self.performance_stats["total_processing_time"] += processing_time
-                self.performance_stats["stt_network_time"] += network_time
-                self.performance_stats["average_processing_time"] = (
-                    self.performance_stats["total_processing_time"] / 
-                    (self.performance_stats["total_tts_calls"] + self.performance_stats["total_stt_calls"])
-                )
-                
-                # Track ultra-fast chunks (under 1 second)
-                if processing_time < 1.0:
-                    self.performance_stats["stt_ultra_fast_chunks"] += 1
-                
-                # Update fastest chunk time
-                self.performance_stats["stt_fastest_chunk"] = min(
-                    self.performance_stats["stt_fastest_chunk"], processing_time
-                )
+            self.performance_stats.total_stt_calls += 1
+            self.performance_stats.total_processing_time += processing_time
+            self.performance_stats.stt_network_time += network_time
             
-            print(f"⚡ DIRECT STT completed in {processing_time:.2f}s (network: {network_time:.2f}s)")
+            # Track ultra-fast chunks (under 1 second)
+            if processing_time < 1.0:
+                self.performance_stats.stt_ultra_fast_chunks += 1
+            
+            # Update fastest chunk time
+            self.performance_stats.stt_fastest_chunk = min(
+                self.performance_stats.stt_fastest_chunk, processing_time
+            )
+            
+            logger.info("⚡ DIRECT STT completed in %.2fs (network: %.2fs)", processing_time, network_time)
             
             return ProcessedAudioData(
                 audio_id=audio_data.audio_id,
@@ -181,7 +250,7 @@ class AudioService(IAudioService):
             )
             
         except Exception as e:
-            print(f"❌ Error in direct audio processing: {e}")
+            logger.error("❌ Error in direct audio processing: %s", e)
             raise
     
     async def _process_audio_chunked(self, audio_data: AudioData, start_time: float, chunk_seconds: int = 20) -> ProcessedAudioData:
@@ -191,7 +260,7 @@ class AudioService(IAudioService):
                 # Fallback to direct processing if pydub not available
                 return await self._process_audio_direct(audio_data, start_time)
             
-            preprocessing_start = time.time()
+            preprocessing_start = time.perf_counter()
             
             # Load and preprocess audio
             audio_segment = AudioSegment.from_file(io.BytesIO(audio_data.audio_bytes), format=audio_data.format)
@@ -208,58 +277,34 @@ class AudioService(IAudioService):
                 if len(chunk) > 1000:  # Skip very short chunks
                     chunks.append((i // chunk_length_ms, chunk))
             
-            preprocessing_time = time.time() - preprocessing_start
+            preprocessing_time = time.perf_counter() - preprocessing_start
             
             if not chunks:
                 return ProcessedAudioData(
                     audio_id=audio_data.audio_id,
                     transcription="",
                     confidence=0.0,
-                    processing_time=time.time() - start_time,
+                    processing_time=time.perf_counter() - start_time,
                     language=None  # Auto-detect mixed Arabic/English
                 )
             
-            print(f"🎙️ PARALLEL STT: Processing {len(chunks)} chunks ({chunk_seconds}s each)")
-            
-            # Process chunks in parallel
-            loop = asyncio.get_event_loop()
-            futures = []
-            
-            for chunk_id, chunk in chunks:
-                future = self.tts_executor.submit(self._process_audio_chunk, chunk_id, chunk, audio_data.format)
-                futures.append(future)
+            logger.info("🎙️ PARALLEL STT: Processing %s chunks (%ss each)", len(chunks), chunk_seconds)
             
-            # Collect results
-            results = []
-            for future in as_completed(futures):
-                try:
-                    result = await loop.run_in_executor(None, future.result, 30)  # 30 second timeout
-                    results.append(result)
-                except Exception as e:
-                    print(f"❌ STT Chunk failed: {e}")
-                    with self._stats_lock:
-                        self.performance_stats["failed_chunks"] += 1
-            
-            # Sort and combine results
-            results.sort(key=lambda x: x[0])
+            # Process chunks concurrently; gather keeps results in chunk order
+            results = await self._transcribe_chunks(self._process_audio_chunk, chunks, audio_data.format, 30)  # 30 second timeout
             transcriptions = [result[1] for result in results if result[1]]
             
             combined_transcription = " ".join(transcriptions).strip()
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Update performance stats
-            with self._stats_lock:
-                self.performance_stats["total_stt_calls"] += 1
-                self.performance_stats["stt_parallel_calls"] += 1
-                self.performance_stats["stt_chunks_processed"] += len(chunks)
-                self.performance_stats["stt_preprocessing_time"] += preprocessing_time
-                self.performance_stats["total_processing_time"] += processing_time
-                self.performance_stats["average_processing_time"] = (
-                    self.performance_stats["total_processing_time"] / 
-                    (self.performance_stats["total_tts_calls"] + self.performance_stats["total_stt_calls"])
-                )
+            self.performance_stats.total_stt_calls += 1
+            self.performance_stats.stt_parallel_calls += 1
+            self.performance_stats.stt_chunks_processed += len(chunks)
+            self.performance_stats.stt_preprocessing_time += preprocessing_time
+            self.performance_stats.total_processing_time += processing_time
             
-            print(f"✅ STT completed in {processing_time:.2f}s ({processing_time/len(chunks):.2f}s/chunk)")
+            logger.info("✅ STT completed in %.2fs (%.2fs/chunk)", processing_time, processing_time/len(chunks))
             
             return ProcessedAudioData(
                 audio_id=audio_data.audio_id,
@@ -270,7 +315,7 @@ class AudioService(IAudioService):
             )
             
         except Exception as e:
-            print(f"❌ Error in chunked audio processing: {e}")
+            logger.error("❌ Error in chunked audio processing: %s", e)
             raise
     
     async def _process_audio_ultra_fast(self, audio_data: AudioData, start_time: float, chunk_seconds: int = 5) -> ProcessedAudioData:
@@ -280,7 +325,7 @@ class AudioService(IAudioService):
                 # Fallback to direct processing if pydub not available
                 return await self._process_audio_direct(audio_data, start_time)
             
-            preprocessing_start = time.time()
+            preprocessing_start = time.perf_counter()
             
             # Load audio with ultra-fast processing
             audio_segment = AudioSegment.from_file(io.BytesIO(audio_data.audio_bytes), format=audio_data.format)
@@ -306,70 +351,47 @@ class AudioService(IAudioService):
                 if chunk_end >= len(audio_segment):
                     break
             
-            preprocessing_time = time.time() - preprocessing_start
+            preprocessing_time = time.perf_counter() - preprocessing_start
             
             if not chunks:
                 return ProcessedAudioData(
                     audio_id=audio_data.audio_id,
                     transcription="",
                     confidence=0.0,
-                    processing_time=time.time() - start_time,
+                    processing_time=time.perf_counter() - start_time,
                     language=None  # Auto-detect mixed Arabic/English
                 )
             
-            print(f"🚀 ULTRA-FAST STT: Processing {len(chunks)} micro-chunks ({chunk_seconds}s each, 0.5s overlap)")
+            logger.info("🚀 ULTRA-FAST STT: Processing %s micro-chunks (%ss each, 0.5s overlap)", len(chunks), chunk_seconds)
             
-            # Process chunks in parallel using dedicated STT executor
-            loop = asyncio.get_event_loop()
-            futures = []
+            # Process chunks concurrently with reduced timeout; gather keeps results in chunk order
+            results = await self._transcribe_chunks(self._process_audio_chunk_ultra_fast, chunks, audio_data.format, 15)
             
-            for chunk_id, chunk in chunks:
-                future = self.stt_executor.submit(self._process_audio_chunk_ultra_fast, chunk_id, chunk, audio_data.format)
-                futures.append(future)
-            
-            # Collect results with reduced timeout for faster processing
-            results = []
-            for future in as_completed(futures):
-                try:
-                    result = await loop.run_in_executor(None, future.result, 15)  # Reduced timeout to 15 seconds
-                    results.append(result)
-                except Exception as e:
-                    print(f"❌ Ultra-fast STT Chunk failed: {e}")
-                    with self._stats_lock:
-                        self.performance_stats["failed_chunks"] += 1
-            
-            # Sort and intelligently combine overlapping results
-            results.sort(key=lambda x: x[0])
+            # Intelligently combine overlapping results
             transcriptions = [result[1] for result in results if result[1]]
             
             # Smart deduplication for overlapping chunks
             combined_transcription = self._deduplicate_overlapping_transcriptions(transcriptions)
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Enhanced performance stats tracking
-            with self._stats_lock:
-                self.performance_stats["total_stt_calls"] += 1
-                self.performance_stats["stt_parallel_calls"] += 1
-                self.performance_stats["stt_chunks_processed"] += len(chunks)
-                self.performance_stats["stt_preprocessing_time"] += preprocessing_time
-                self.performance_stats["total_processing_time"] += processing_time
-                
-                # Track ultra-fast processing
-                avg_chunk_time = processing_time / len(chunks) if chunks else 0
-                if avg_chunk_time < 1.0:
-                    self.performance_stats["stt_ultra_fast_chunks"] += len(chunks)
-                
-                # Update fastest processing time
-                self.performance_stats["stt_fastest_chunk"] = min(
-                    self.performance_stats["stt_fastest_chunk"], avg_chunk_time
-                )
-                
-                self.performance_stats["average_processing_time"] = (
-                    self.performance_stats["total_processing_time"] / 
-                    (self.performance_stats["total_tts_calls"] + self.performance_stats["total_stt_calls"])
-                )
+            self.performance_stats.total_stt_calls += 1
+            self.performance_stats.stt_parallel_calls += 1
+            self.performance_stats.stt_chunks_processed += len(chunks)
+            self.performance_stats.stt_preprocessing_time += preprocessing_time
+            self.performance_stats.total_processing_time += processing_time
+            
+            # Track ultra-fast processing
+            avg_chunk_time = processing_time / len(chunks) if chunks else 0
+            if avg_chunk_time < 1.0:
+                self.performance_stats.stt_ultra_fast_chunks += len(chunks)
+            
+            # Update fastest processing time
+            self.performance_stats.stt_fastest_chunk = min(
+                self.performance_stats.stt_fastest_chunk, avg_chunk_time
+            )
             
-            print(f"✅ ULTRA-FAST STT completed in {processing_time:.2f}s ({avg_chunk_time:.2f}s/chunk)")
+            logger.info("✅ ULTRA-FAST STT completed in %.2fs (%.2fs/chunk)", processing_time, avg_chunk_time)
             
             return ProcessedAudioData(
                 audio_id=audio_data.audio_id,
@@ -380,25 +402,37 @@ class AudioService(IAudioService):
             )
             
         except Exception as e:
-            print(f"❌ Error in ultra-fast audio processing: {e}")
+            logger.error("❌ Error in ultra-fast audio processing: %s", e)
             raise
     
-    def _process_audio_chunk(self, chunk_id: int, audio_chunk: AudioSegment, format: str) -> Tuple[int, str]:
+    async def _transcribe_chunks(self, transcribe, chunks: List[Tuple[int, AudioSegment]], format: str, timeout: float) -> List[Tuple[int, str]]:
+        """Run one transcription coroutine per chunk concurrently, counting timeouts and failures"""
+        results = await asyncio.gather(
+            *(asyncio.wait_for(transcribe(chunk_id, chunk, format), timeout) for chunk_id, chunk in chunks),
+            return_exceptions=True
+        )
+        completed = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("❌ STT Chunk failed: %r", result)
+                self.performance_stats.failed_chunks += 1
+            else:
+                completed.append(result)
+        return completed
+    
+    async def _process_audio_chunk(self, chunk_id: int, audio_chunk: AudioSegment, format: str) -> Tuple[int, str]:
         """Process a single audio chunk for transcription"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
-            # Export chunk to bytes
+            # Export chunk to bytes (pydub encoding is blocking, keep it off the event loop)
             chunk_buffer = io.BytesIO()
-            audio_chunk.export(chunk_buffer, format=format)
+            await asyncio.to_thread(audio_chunk.export, chunk_buffer, format=format)
             chunk_buffer.seek(0)
             chunk_buffer.name = f"chunk_{chunk_id}.{format}"
             
-            # Create dedicated client for this thread
-            client = OpenAI(api_key=self.api_key)
-            
             # Transcribe chunk with auto-detection for mixed languages
-            transcript = client.audio.transcriptions.create(
+            transcript = await self.client.audio.transcriptions.create(
                 model="whisper-1",
                 file=chunk_buffer,
                 language="en",
@@ -406,64 +440,60 @@ class AudioService(IAudioService):
                 # No language parameter - enables auto-detection for mixed Arabic-English
             )
             
-            processing_time = time.time() - start_time
-            print(f"🎙️ STT Chunk {chunk_id} completed in {processing_time:.2f}s")
+            processing_time = time.perf_counter() - start_time
+            logger.debug("🎙️ STT Chunk %s completed in %.2fs", chunk_id, processing_time)
             
             return (chunk_id, transcript.text.strip())
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            print(f"❌ STT Chunk {chunk_id} failed in {processing_time:.2f}s: {e}")
+            processing_time = time.perf_counter() - start_time
+            logger.warning("❌ STT Chunk %s failed in %.2fs: %s", chunk_id, processing_time, e)
             return (chunk_id, "")
     
-    def _process_audio_chunk_ultra_fast(self, chunk_id: int, audio_chunk: AudioSegment, format: str) -> Tuple[int, str]:
+    async def _process_audio_chunk_ultra_fast(self, chunk_id: int, audio_chunk: AudioSegment, format: str) -> Tuple[int, str]:
         """Process a single audio chunk with ultra-fast optimizations"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         try:
             # Ultra-fast compression and optimization
-            compression_start = time.time()
+            compression_start = time.perf_counter()
             
             # Export chunk with compression
             chunk_buffer = io.BytesIO()
             # Use MP3 format for consistent processing per user preference
             compressed_format = "mp3" if format.lower() in ["wav", "m4a", "flac"] else format
             if compressed_format == "mp3":
-                audio_chunk.export(chunk_buffer, format=compressed_format)
+                await asyncio.to_thread(audio_chunk.export, chunk_buffer, format=compressed_format)
             else:
-                audio_chunk.export(chunk_buffer, format=compressed_format, bitrate="64k")
+                await asyncio.to_thread(audio_chunk.export, chunk_buffer, format=compressed_format, bitrate="64k")
             chunk_buffer.seek(0)
             chunk_buffer.name = f"ultra_chunk_{chunk_id}.{compressed_format}"
             
-            compression_time = time.time() - compression_start
-            
-            # Create dedicated client for this thread
-            client = OpenAI(api_key=self.api_key)
+            compression_time = time.perf_counter() - compression_start
             
             # Ultra-fast transcription with optimized settings
-            network_start = time.time()
-            transcript = client.audio.transcriptions.create(
+            network_start = time.perf_counter()
+            transcript = await self.client.audio.transcriptions.create(
                 model="whisper-1",
                 file=chunk_buffer,
                 language="en",
                 #prompt="The user is speaking in Arabic Omani Dialect and English. Not in Indonesia anymore. Mind with the language detection and transcribe the text in the correct language.",
             )
-            network_time = time.time() - network_start
+            network_time = time.perf_counter() - network_start
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Track compression and network times
-            with self._stats_lock:
-                self.performance_stats["stt_compression_time"] += compression_time
-                self.performance_stats["stt_network_time"] += network_time
+            self.performance_stats.stt_compression_time += compression_time
+            self.performance_stats.stt_network_time += network_time
             
-            print(f"🚀 Ultra-fast STT Chunk {chunk_id} completed in {processing_time:.2f}s (compression: {compression_time:.2f}s, network: {network_time:.2f}s)")
+            logger.debug("🚀 Ultra-fast STT Chunk %s completed in %.2fs (compression: %.2fs, network: %.2fs)", chunk_id, processing_time, compression_time, network_time)
             
             return (chunk_id, transcript.text.strip())
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            print(f"❌ Ultra-fast STT Chunk {chunk_id} failed in {processing_time:.2f}s: {e}")
+            processing_time = time.perf_counter() - start_time
+            logger.warning("❌ Ultra-fast STT Chunk %s failed in %.2fs: %s", chunk_id, processing_time, e)
             return (chunk_id, "")
     
     async def _preprocess_audio(self, audio_bytes: bytes, format: str) -> bytes:
@@ -484,7 +514,7 @@ class AudioService(IAudioService):
             return output_buffer.getvalue()
             
         except Exception as e:
-            print(f"⚠️ Audio preprocessing failed: {e}")
+            logger.warning("⚠️ Audio preprocessing failed: %s", e)
             return audio_bytes
     
     async def _optimize_audio_segment(self, audio_segment: AudioSegment) -> AudioSegment:
@@ -511,7 +541,7 @@ class AudioService(IAudioService):
             return audio_segment
             
         except Exception as e:
-            print(f"⚠️ Audio optimization failed: {e}")
+            logger.warning("⚠️ Audio optimization failed: %s", e)
             return audio_segment
     
     async def _preprocess_audio_ultra_fast(self, audio_bytes: bytes, format: str) -> bytes:
@@ -533,7 +563,7 @@ class AudioService(IAudioService):
             return output_buffer.getvalue()
             
         except Exception as e:
-            print(f"⚠️ Ultra-fast audio preprocessing failed: {e}")
+            logger.warning("⚠️ Ultra-fast audio preprocessing failed: %s", e)
             return audio_bytes
     
     async def _optimize_audio_segment_ultra_fast(self, audio_segment: AudioSegment) -> AudioSegment:
@@ -563,7 +593,7 @@ class AudioService(IAudioService):
             return audio_segment
             
         except Exception as e:
-            print(f"⚠️ Ultra-fast audio optimization failed: {e}")
+            logger.warning("⚠️ Ultra-fast audio optimization failed: %s", e)
             return audio_segment
     
     def _deduplicate_overlapping_transcriptions(self, transcriptions: List[str]) -> str:
@@ -598,7 +628,7 @@ class AudioService(IAudioService):
             return result
             
         except Exception as e:
-            print(f"⚠️ Deduplication failed: {e}")
+            logger.warning("⚠️ Deduplication failed: %s", e)
             # Fallback: just join all transcriptions
             return " ".join(transcriptions)
     
@@ -625,14 +655,38 @@ class AudioService(IAudioService):
             }
             return
         
-        start_time = time.time()
+        # A cached sentence is replayed as one frame instead of a new streaming request
+        cache_key = self._tts_cache_key("stream", text)
+        cached = self._tts_cache_get(cache_key)
+        if cached is not None:
+            audio_data = AudioData(audio_bytes=cached, format="wav", duration=_wav_duration(cached))
+            yield {
+                "type": "streaming_chunk",
+                "chunk_id": 0,
+                "audio_data": audio_data,
+                "text": text,
+                "partial": True,
+                "success": True
+            }
+            yield {
+                "type": "streaming_complete",
+                "chunk_id": 1,
+                "audio_data": audio_data,
+                "text": text,
+                "processing_time": 0.0,
+                "total_chunks": 1,
+                "success": True
+            }
+            return
+        
+        start_time = time.perf_counter()
         chunk_id = 0
         
         try:
-            print(f"🚀 Starting optimized streaming TTS for text: '{text[:30]}...'")
+            logger.debug("🚀 Starting optimized streaming TTS for text: '%s...'", text[:30])
             
             # Use OpenAI's streaming TTS API with optimized settings
-            with self.client.audio.speech.with_streaming_response.create(
+            async with self.client.audio.speech.with_streaming_response.create(
                 model="gpt-4o-mini-tts",  # Keep same model as specified
                 voice="alloy",
                 input=text,
@@ -644,11 +698,11 @@ class AudioService(IAudioService):
                 # Buffer for accumulating audio chunks
                 audio_buffer = b""
                 # Use optimized buffer size from settings
-                buffer_size = settings.audio_config.streaming_buffer_size  # 4KB for faster streaming
+                buffer_size = self._streaming_buffer_size  # 4KB for faster streaming
                 
                 # Process streaming response
                 # Process streaming response
-                for chunk in response.iter_bytes(chunk_size=buffer_size):
+                async for chunk in response.iter_bytes(chunk_size=buffer_size):
                             if chunk:
                                 audio_buffer += chunk
                                 
@@ -667,24 +721,19 @@ class AudioService(IAudioService):
                                 }
                                 
                                 chunk_id += 1
-                                print(f"⚡ Fast streaming chunk {chunk_id} ({len(chunk)} bytes)")
+                                logger.debug("⚡ Fast streaming chunk %s (%s bytes)", chunk_id, len(chunk))
                                 
                                 # Optional: Add small delay to prevent overwhelming the client
                                 # await asyncio.sleep(0.01)  # 10ms delay
                 
                 # Calculate processing time
-                processing_time = time.time() - start_time
+                processing_time = time.perf_counter() - start_time
                 
                 # Update performance stats
-                with self._stats_lock:
-                    self.performance_stats["total_tts_calls"] += 1
-                    self.performance_stats["total_processing_time"] += processing_time
-                    self.performance_stats["successful_chunks"] += chunk_id
-                    
-                    # Calculate average time
-                    if self.performance_stats["total_tts_calls"] > 0:
-                        avg_time = self.performance_stats["total_processing_time"] / self.performance_stats["total_tts_calls"]
-                        self.performance_stats["average_processing_time"] = avg_time
+                self.performance_stats.total_tts_calls += 1
+                self.performance_stats.total_processing_time += processing_time
+                self.performance_stats.successful_chunks += chunk_id
+                self._tts_cache_put(cache_key, audio_buffer)
                 
                 # Final yield with complete audio
                 yield {
@@ -693,7 +742,7 @@ class AudioService(IAudioService):
                     "audio_data": AudioData(
                         audio_bytes=audio_buffer,
                         format="wav",
-                        duration=len(audio_buffer) / 16000.0  # Estimated duration
+                        duration=_wav_duration(audio_buffer)
                     ),
                     "text": text,
                     "processing_time": processing_time,
@@ -701,10 +750,10 @@ class AudioService(IAudioService):
                     "success": True
                 }
                 
-                print(f"✅ Optimized streaming TTS completed in {processing_time:.2f}s with {chunk_id} chunks")
+                logger.info("✅ Optimized streaming TTS completed in %.2fs with %s chunks", processing_time, chunk_id)
                 
         except Exception as e:
-            print(f"❌ Optimized streaming TTS error: {e}")
+            logger.error("❌ Optimized streaming TTS error: %s", e)
             yield {
                 "type": "streaming_error",
                 "chunk_id": chunk_id,
@@ -721,135 +770,203 @@ class AudioService(IAudioService):
         if not text or not text.strip():
             return AudioData(
                 audio_bytes=b"",
-                format=settings.audio_config.default_format,
+                format=self._default_format,
                 duration=0.0
             )
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        # Repeated utterances (greetings, confirmations) come straight from memory
+        full_key = self._tts_cache_key("full", text)
+        cached = self._tts_cache_get(full_key)
+        if cached is not None:
+            return AudioData(
+                audio_bytes=cached,
+                format=self._default_format,
+                duration=_wav_duration(cached)
+            )
         
         try:
             # Fast text chunking with optimized algorithm
-            sentences = self._split_text_into_sentences(text, settings.audio_config.max_chunk_size)
-            
-            if not sentences:
-                return AudioData(
-                    audio_bytes=b"",
-                    format=settings.audio_config.default_format,
-                    duration=0.0
-                )
-            
-            # Skip chunking for single short sentences (faster direct processing)
-            if len(sentences) == 1 and len(sentences[0]) <= 50:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(self.tts_executor, self._process_chunk, 0, sentences[0])
-                
-                return AudioData(
-                    audio_bytes=result[1],
-                    format=settings.audio_config.default_format,
-                    duration=0.0
-                )
-            
-            # Optimize worker count based on chunk size and available resources
-            workers_to_use = min(len(sentences), max_workers or settings.audio_config.max_workers)
-            
-            print(f"⚡ OPTIMIZED TTS: Processing {len(sentences)} chunks with {workers_to_use} workers")
+            sentences = self._split_text_into_sentences(text, self._max_chunk_size, self._min_split_size)
             
-            # Process all chunks concurrently with efficient async handling
-            loop = asyncio.get_event_loop()
-            tasks = []
-            
-            for i, sentence in enumerate(sentences):
-                task = loop.run_in_executor(self.tts_executor, self._process_chunk, i, sentence)
-                tasks.append(task)
-            
-            # Wait for all results with optimized gathering
-            try:
-                results = await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=settings.audio_config.tts_timeout * len(sentences)  # Scale timeout with chunk count
-                )
-            except asyncio.TimeoutError:
-                print(f"⏱️ TTS processing timeout after {settings.audio_config.tts_timeout * len(sentences)}s")
-                # Return partial results if available
-                results = []
-                for task in tasks:
-                    if task.done():
-                        try:
-                            results.append(task.result())
-                        except:
-                            results.append((0, b""))
-                    else:
-                        results.append((0, b""))
-            
-            # Filter successful results and sort by chunk ID
-            successful_results = []
-            for result in results:
-                if isinstance(result, tuple) and len(result) == 2 and result[1]:
-                    successful_results.append(result)
-                elif isinstance(result, Exception):
-                    print(f"⚠️ TTS chunk failed: {result}")
-            
-            if not successful_results:
+            # Collect the in-order chunk stream; chunks that failed or missed the deadline are absent
+            async with aclosing(self._stream_sentence_audio(sentences, max_workers)) as chunk_stream:
+                audio_chunks = [audio_bytes async for audio_bytes in chunk_stream]
+            if not audio_chunks:
                 return AudioData(
                     audio_bytes=b"",
-                    format=settings.audio_config.default_format,
+                    format=self._default_format,
                     duration=0.0
                 )
             
-            # Sort and merge results efficiently
-            successful_results.sort(key=lambda x: x[0])  # Sort by chunk_id
-            audio_chunks = [result[1] for result in successful_results]
-            
             # Fast audio merging
             merged_audio = self._merge_audio_chunks(audio_chunks)
+            if len(sentences) > 1 and len(audio_chunks) == len(sentences):
+                # Only complete audio is cached (a timed-out chunk should be retried next time);
+                # a single chunk is already cached under its chunk key
+                self._tts_cache_put(full_key, merged_audio)
             
-            total_time = time.time() - start_time
-            print(f"🎉 TOTAL TTS TIME: {total_time:.2f}s for {len(sentences)} chunks ({total_time/len(sentences):.2f}s/chunk)")
+            total_time = time.perf_counter() - start_time
+            logger.debug("🎉 TOTAL TTS TIME: %.2fs for %s chunks (%.2fs/chunk)", total_time, len(sentences), total_time/len(sentences))
             
             return AudioData(
                 audio_bytes=merged_audio,
-                format=settings.audio_config.default_format,
-                duration=0.0
+                format=self._default_format,
+                duration=_wav_duration(merged_audio)
             )
             
         except Exception as e:
-            print(f"❌ Critical TTS error: {e}")
+            logger.error("❌ Critical TTS error: %s", e)
             return AudioData(
                 audio_bytes=b"",
-                format=settings.audio_config.default_format,
+                format=self._default_format,
                 duration=0.0
             )
     
-    def _process_chunk(self, chunk_id: int, text: str) -> Tuple[int, bytes]:
+    async def text_to_speech_stream(self, text: str, max_workers: int = None) -> AsyncGenerator[bytes, None]:
+        """
+        Parallel text-to-speech that yields each chunk's WAV audio in playback order
+        as soon as it (and every chunk before it) is ready, instead of waiting for the slowest chunk
+        """
+        if not text or not text.strip():
+            return
+        
+        cached = self._tts_cache_get(self._tts_cache_key("full", text))
+        if cached is not None:
+            yield cached
+            return
+        
+        sentences = self._split_text_into_sentences(text, self._max_chunk_size, self._min_split_size)
+        async with aclosing(self._stream_sentence_audio(sentences, max_workers)) as chunk_stream:
+            async for audio_bytes in chunk_stream:
+                yield audio_bytes
+    
+    async def _stream_sentence_audio(self, sentences: List[str], max_workers: Optional[int]) -> AsyncGenerator[bytes, None]:
+        """
+        Synthesize chunks in parallel and yield their audio in chunk order.
+        Awaiting the tasks in submission order is the reorder buffer; a failed chunk is skipped,
+        and the stream ends at the first chunk that misses the overall deadline.
+        """
+        if not sentences:
+            return
+        
+        # Skip chunking for single short sentences (faster direct processing)
+        if len(sentences) == 1 and len(sentences[0]) <= 50:
+            _, audio_bytes = await self._process_chunk(0, sentences[0])
+            if audio_bytes:
+                yield audio_bytes
+            return
+        
+        tasks = self._start_tts_chunks(sentences, max_workers)
+        loop = asyncio.get_running_loop()
+        timeout = self._tts_timeout * len(sentences)  # Scale timeout with chunk count
+        deadline = loop.time() + timeout
+        try:
+            for task in tasks:
+                try:
+                    _, audio_bytes = await asyncio.wait_for(task, deadline - loop.time())
+                except asyncio.TimeoutError:
+                    logger.warning("⏱️ TTS processing timeout after %ss", timeout)
+                    break
+                except Exception as e:
+                    logger.warning("⚠️ TTS chunk failed: %s", e)
+                    continue
+                if audio_bytes:
+                    yield audio_bytes
+        finally:
+            # Closing the stream early (or a timeout) drops the chunks nobody will receive
+            for task in tasks:
+                task.cancel()
+    
+    def _start_tts_chunks(self, sentences: List[str], max_workers: Optional[int]) -> List["asyncio.Task[Tuple[int, bytes]]"]:
+        """
+        Schedule TTS tasks for the chunks, one per position, with at most max_workers requests in flight.
+        Repeated chunk texts ("Ya.", list items) share a single task instead of paying another round trip.
+        """
+        # Optimize worker count based on chunk size and available resources
+        unique_count = len(set(sentences))
+        workers_to_use = min(unique_count, max_workers or self._max_parallel_tts)
+        
+        logger.debug("⚡ OPTIMIZED TTS: Processing %s chunks (%s unique) with %s workers", len(sentences), unique_count, workers_to_use)
+        
+        limiter = asyncio.Semaphore(workers_to_use)
+        
+        async def limited_chunk(chunk_id: int, sentence: str) -> Tuple[int, bytes]:
+            async with limiter:
+                return await self._process_chunk(chunk_id, sentence)
+        
+        tasks_by_text = {}
+        for i, sentence in enumerate(sentences):
+            if sentence not in tasks_by_text:
+                tasks_by_text[sentence] = asyncio.ensure_future(limited_chunk(i, sentence))
+        return [tasks_by_text[sentence] for sentence in sentences]
+    
+    async def _process_chunk(self, chunk_id: int, text: str) -> Tuple[int, bytes]:
         """Ultra-fast TTS chunk processing - optimized for speed"""
-        start_time = time.time()
+        key = self._tts_cache_key("chunk", text)
+        cached = self._tts_cache_get(key)
+        if cached is not None:
+            return (chunk_id, cached)
+        
+        start_time = time.perf_counter()
         
         try:
-            # Create dedicated client for this thread (no nested executor)
-            client = OpenAI(api_key=self.api_key)
-            
             # Direct TTS call with optimized parameters
-            response = client.audio.speech.create(
-                model="gpt-4o-mini-tts",
-                voice="alloy",
-                input=text,
-                response_format="wav",
-                speed=1.0  # Normal speed for clarity
-            )
+            response = await self._create_chunk_speech(text)
             
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
             
             # Only log slow chunks to reduce overhead
             if processing_time > 1.0:
-                print(f"⚡ Chunk {chunk_id} completed in {processing_time:.2f}s")
+                logger.debug("⚡ Chunk %s completed in %.2fs", chunk_id, processing_time)
             
+            self._tts_cache_put(key, response.content)
             return (chunk_id, response.content)
             
         except Exception as e:
-            processing_time = time.time() - start_time
-            print(f"❌ Chunk {chunk_id} failed in {processing_time:.2f}s: {e}")
+            processing_time = time.perf_counter() - start_time
+            logger.warning("❌ Chunk %s failed in %.2fs: %s", chunk_id, processing_time, e)
             return (chunk_id, b"")
     
+    async def _create_chunk_speech(self, text: str):
+        """TTS request for one chunk, retried with jittered exponential backoff on 429/5xx/connection errors"""
+        for attempt in range(self._tts_retries + 1):
+            try:
+                return await self._chunk_client.audio.speech.create(input=text, **_CHUNK_TTS_PARAMS)
+            except (APIConnectionError, APIStatusError) as e:
+                retryable = isinstance(e, APIConnectionError) or e.status_code == 429 or e.status_code >= 500
+                if not retryable or attempt == self._tts_retries:
+                    raise
+                await asyncio.sleep(self._tts_retry_backoff * (2 ** attempt) + random.random() * 0.1)
+    
+    @staticmethod
+    def _tts_cache_key(kind: str, text: str) -> bytes:
+        """Cache key for synthesized audio of `text`; `kind` separates chunk, full-text and streamed requests"""
+        params = _CHUNK_TTS_PARAMS
+        raw = f"{kind}|{params['model']}|{params['voice']}|{params['response_format']}|{text}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).digest()
+    
+    def _tts_cache_get(self, key: bytes) -> Optional[bytes]:
+        """Look up cached audio, marking it most recently used"""
+        audio_bytes = self._tts_cache.get(key)
+        if audio_bytes is not None:
+            self._tts_cache.move_to_end(key)
+        return audio_bytes
+    
+    def _tts_cache_put(self, key: bytes, audio_bytes: bytes):
+        """Cache audio and evict least recently used entries past the byte budget"""
+        if not audio_bytes or len(audio_bytes) > self._tts_cache_max_bytes:
+            return
+        previous = self._tts_cache.pop(key, None)
+        if previous is not None:
+            self._tts_cache_bytes -= len(previous)
+        self._tts_cache[key] = audio_bytes
+        self._tts_cache_bytes += len(audio_bytes)
+        while self._tts_cache_bytes > self._tts_cache_max_bytes:
+            _, evicted = self._tts_cache.popitem(last=False)
+            self._tts_cache_bytes -= len(evicted)
+    
     def _merge_audio_chunks(self, audio_chunks: List[bytes]) -> bytes:
         """Ultra-fast audio merging optimized for WAV format"""
         if not audio_chunks:
@@ -858,15 +975,18 @@ class AudioService(IAudioService):
         if len(audio_chunks) == 1:
             return audio_chunks[0]
         
-        # For WAV files, direct concatenation after header handling
+        # Same-format WAV chunks: splice the sample data under a single header (no decode/re-encode)
+        parsed_chunks = [_parse_wav(chunk) for chunk in audio_chunks if chunk]
+        if parsed_chunks and all(
+            parsed is not None and parsed[0] == parsed_chunks[0][0] for parsed in parsed_chunks
+        ):
+            return _build_wav(parsed_chunks[0][0], [samples for _, samples in parsed_chunks])
+        
+        # Mixed or non-WAV input: fall back to pydub merging
         try:
             if not PYDUB_AVAILABLE:
                 # Simple byte concatenation for WAV files (preserves compatibility)
-                merged = b""
-                for chunk in audio_chunks:
-                    if chunk:
-                        merged += chunk
-                return merged
+                return b"".join(audio_chunks)
             
             # Use pydub for proper audio merging (when available)
             audio_segments = []
@@ -882,10 +1002,20 @@ class AudioService(IAudioService):
             if not audio_segments:
                 return b""
             
-            # Fast concatenation
-            merged_segment = audio_segments[0]
-            for segment in audio_segments[1:]:
-                merged_segment += segment
+            # Concatenate in one pass: bring all segments to a common format (as `+` does
+            # pairwise) and join their raw frames, instead of re-copying the merged audio per chunk
+            channels = max(segment.channels for segment in audio_segments)
+            frame_rate = max(segment.frame_rate for segment in audio_segments)
+            sample_width = max(segment.sample_width for segment in audio_segments)
+            merged_segment = AudioSegment(
+                data=b"".join(
+                    segment.set_channels(channels).set_frame_rate(frame_rate).set_sample_width(sample_width).raw_data
+                    for segment in audio_segments
+                ),
+                sample_width=sample_width,
+                frame_rate=frame_rate,
+                channels=channels
+            )
             
             # Export to bytes
             output_buffer = io.BytesIO()
@@ -893,15 +1023,11 @@ class AudioService(IAudioService):
             return output_buffer.getvalue()
             
         except Exception as e:
-            print(f"⚠️ Audio merge fallback: {e}")
+            logger.warning("⚠️ Audio merge fallback: %s", e)
             # Emergency fallback: simple concatenation
-            merged = b""
-            for chunk in audio_chunks:
-                if chunk:
-                    merged += chunk
-            return merged
+            return b"".join(audio_chunks)
     
-    def _split_text_into_sentences(self, text: str, max_chunk_size: int = 150) -> List[str]:
+    def _split_text_into_sentences(self, text: str, max_chunk_size: int = 150, min_split_size: int = 0) -> List[str]:
         """
         Ultra-fast intelligent text chunking optimized for mixed Arabic-English content
         Reduces processing time by 60-80% through smarter algorithms
@@ -911,163 +1037,93 @@ class AudioService(IAudioService):
         
         text = text.strip()
         
-        # For very short texts, don't chunk at all - direct processing is faster
-        if len(text) <= max_chunk_size:
+        # For short texts, don't chunk at all - one TTS request beats splitting
+        # responses that sit just above max_chunk_size
+        if len(text) <= max(max_chunk_size, min_split_size):
             return [text]
         
-        # Fast chunking with language-aware boundaries
-        chunks = []
-        current_chunk = ""
+        # Split on natural sentence boundaries in a single regex pass
+        sentences = [sentence for sentence in _SENTENCE_SPLIT_RE.split(text) if sentence]
         
-        # Split on natural sentence boundaries first (more efficient than complex regex)
-        sentence_endings = ['. ', '! ', '? ', '.\n', '!\n', '?\n']
+        # Size limit chosen up front so long texts pack into roughly _MAX_TTS_CHUNKS chunks
+        limit = max(max_chunk_size, math.ceil(len(text) / _MAX_TTS_CHUNKS))
         
-        # Find all sentence boundaries quickly
-        boundaries = []
-        for ending in sentence_endings:
-            pos = 0
-            while True:
-                pos = text.find(ending, pos)
-                if pos == -1:
-                    break
-                boundaries.append(pos + len(ending))
-                pos += 1
+        # Greedily pack whole sentences (or the words of oversized ones) into chunks
+        chunks = []
+        parts = []
+        size = 0
+        for sentence in sentences:
+            for piece in ([sentence] if len(sentence) <= limit else sentence.split()):
+                if parts and size + 1 + len(piece) > limit:
+                    chunks.append(" ".join(parts))
+                    parts = []
+                    size = 0
+                size += len(piece) + (1 if parts else 0)
+                parts.append(piece)
+        if parts:
+            chunks.append(" ".join(parts))
         
-        # Sort boundaries and remove duplicates
-        boundaries = sorted(set(boundaries))
+        return chunks or [text]  # Fallback to original text if all else fails
+    
+    def get_performance_stats(self) -> Dict[str, Any]:
+        """Get current performance statistics"""
+        stats = asdict(self.performance_stats)
         
-        # Split text at boundaries
-        sentences = []
-        start = 0
-        for boundary in boundaries:
-            if boundary <= len(text):
-                sentence = text[start:boundary].strip()
-                if sentence:
-                    sentences.append(sentence)
-                start = boundary
+        # Handle infinity values for JSON serialization
+        if stats["fastest_chunk_time"] == float('inf'):
+            stats["fastest_chunk_time"] = 0.0
+        if stats["stt_fastest_chunk"] == float('inf'):
+            stats["stt_fastest_chunk"] = 0.0
         
-        # Add remaining text
-        if start < len(text):
-            remaining = text[start:].strip()
-            if remaining:
-                sentences.append(remaining)
+        # Calculate additional metrics
+        total_calls = stats["total_tts_calls"] + stats["total_stt_calls"]
+        if total_calls > 0:
+            stats["average_processing_time"] = stats["total_processing_time"] / total_calls
         
-        # If no natural boundaries found, use space-based chunking
-        if not sentences:
-            words = text.split()
-            current_chunk = ""
-            for word in words:
-                if len(current_chunk) + len(word) + 1 <= max_chunk_size:
-                    current_chunk = f"{current_chunk} {word}".strip()
-                else:
-                    if current_chunk:
-                        sentences.append(current_chunk)
-                    current_chunk = word
-            if current_chunk:
-                sentences.append(current_chunk)
+        if stats["successful_chunks"] > 0:
+            stats["success_rate"] = (stats["successful_chunks"] / 
+                                  (stats["successful_chunks"] + stats["failed_chunks"]) * 100)
+        else:
+            stats["success_rate"] = 0.0
         
-        # Optimize chunk sizes for parallel processing
-        optimized_chunks = []
-        for sentence in sentences:
-            if len(sentence) <= max_chunk_size:
-                optimized_chunks.append(sentence)
-            else:
-                # Split oversized chunks efficiently
-                words = sentence.split()
-                chunk = ""
-                for word in words:
-                    if len(chunk) + len(word) + 1 <= max_chunk_size:
-                        chunk = f"{chunk} {word}".strip()
-                    else:
-                        if chunk:
-                            optimized_chunks.append(chunk)
-                        chunk = word
-                if chunk:
-                    optimized_chunks.append(chunk)
+        # STT-specific metrics
+        if stats["stt_parallel_calls"] > 0:
+            stats["stt_avg_chunks_per_call"] = stats["stt_chunks_processed"] / stats["stt_parallel_calls"]
+            stats["stt_avg_preprocessing_time"] = stats["stt_preprocessing_time"] / stats["stt_parallel_calls"]
+            stats["stt_avg_compression_time"] = stats["stt_compression_time"] / stats["stt_parallel_calls"]
+            stats["stt_avg_network_time"] = stats["stt_network_time"] / stats["stt_parallel_calls"]
+        else:
+            stats["stt_avg_chunks_per_call"] = 0.0
+            stats["stt_avg_preprocessing_time"] = 0.0
+            stats["stt_avg_compression_time"] = 0.0
+            stats["stt_avg_network_time"] = 0.0
         
-        # Filter empty chunks and return
-        result = [chunk.strip() for chunk in optimized_chunks if chunk.strip()]
+        # Ultra-fast performance metrics
+        if stats["stt_chunks_processed"] > 0:
+            stats["stt_ultra_fast_percentage"] = (stats["stt_ultra_fast_chunks"] / stats["stt_chunks_processed"]) * 100
+        else:
+            stats["stt_ultra_fast_percentage"] = 0.0
         
-        # Ensure we have reasonable chunk count for parallel processing
-        if len(result) > 20:  # Too many small chunks can slow down processing
-            # Merge small adjacent chunks
-            merged = []
-            current = ""
-            for chunk in result:
-                if len(current) + len(chunk) + 1 <= max_chunk_size * 1.2:  # Allow 20% overflow for merging
-                    current = f"{current} {chunk}".strip()
-                else:
-                    if current:
-                        merged.append(current)
-                    current = chunk
-            if current:
-                merged.append(current)
-            result = merged
+        stats["workers_available"] = self._max_parallel_tts
+        stats["optimization_features"] = {
+            "parallel_tts": "✅ Enabled",
+            "parallel_stt": "✅ Ultra-Fast Enabled", 
+            "audio_preprocessing": "✅ Ultra-Fast Enabled" if PYDUB_AVAILABLE else "❌ Disabled",
+            "chunking_strategy": "Micro-chunking with overlap (5-8s chunks)",
+            "audio_compression": "✅ 64k bitrate compression",
+            "audio_speedup": "✅ 1.6x playback speed",
+            "async_clients": "✅ Native async TTS/STT"
+        }
         
-        return result or [text]  # Fallback to original text if all else fails
-    
-    def get_performance_stats(self) -> Dict[str, Any]:
-        """Get current performance statistics"""
-        with self._stats_lock:
-            stats = self.performance_stats.copy()
-            
-            # Handle infinity values for JSON serialization
-            if stats["fastest_chunk_time"] == float('inf'):
-                stats["fastest_chunk_time"] = 0.0
-            if stats["stt_fastest_chunk"] == float('inf'):
-                stats["stt_fastest_chunk"] = 0.0
-            
-            # Calculate additional metrics
-            total_calls = stats["total_tts_calls"] + stats["total_stt_calls"]
-            if total_calls > 0:
-                stats["average_processing_time"] = stats["total_processing_time"] / total_calls
-            
-            if stats["successful_chunks"] > 0:
-                stats["success_rate"] = (stats["successful_chunks"] / 
-                                      (stats["successful_chunks"] + stats["failed_chunks"]) * 100)
-            else:
-                stats["success_rate"] = 0.0
-            
-            # STT-specific metrics
-            if stats["stt_parallel_calls"] > 0:
-                stats["stt_avg_chunks_per_call"] = stats["stt_chunks_processed"] / stats["stt_parallel_calls"]
-                stats["stt_avg_preprocessing_time"] = stats["stt_preprocessing_time"] / stats["stt_parallel_calls"]
-                stats["stt_avg_compression_time"] = stats["stt_compression_time"] / stats["stt_parallel_calls"]
-                stats["stt_avg_network_time"] = stats["stt_network_time"] / stats["stt_parallel_calls"]
-            else:
-                stats["stt_avg_chunks_per_call"] = 0.0
-                stats["stt_avg_preprocessing_time"] = 0.0
-                stats["stt_avg_compression_time"] = 0.0
-                stats["stt_avg_network_time"] = 0.0
-            
-            # Ultra-fast performance metrics
-            if stats["stt_chunks_processed"] > 0:
-                stats["stt_ultra_fast_percentage"] = (stats["stt_ultra_fast_chunks"] / stats["stt_chunks_processed"]) * 100
-            else:
-                stats["stt_ultra_fast_percentage"] = 0.0
-            
-            stats["workers_available"] = self.max_workers
-            stats["stt_workers_available"] = self.stt_max_workers
-            stats["optimization_features"] = {
-                "parallel_tts": "✅ Enabled",
-                "parallel_stt": "✅ Ultra-Fast Enabled", 
-                "audio_preprocessing": "✅ Ultra-Fast Enabled" if PYDUB_AVAILABLE else "❌ Disabled",
-                "chunking_strategy": "Micro-chunking with overlap (5-8s chunks)",
-                "audio_compression": "✅ 64k bitrate compression",
-                "audio_speedup": "✅ 1.6x playback speed",
-                "dedicated_stt_executor": f"✅ {self.stt_max_workers} workers"
-            }
-            
-            return stats
+        return stats
     
     def cleanup(self):
         """Cleanup resources"""
+        # The shared HTTP pool belongs to the composition root, which closes it
         try:
-            self.tts_executor.shutdown(wait=True)
-            self.stt_executor.shutdown(wait=True)
-            print("🧹 Ultra-fast audio service cleanup completed")
+            logger.info("🧹 Ultra-fast audio service cleanup completed")
         except Exception as e:
-            print(f"❌ Error during cleanup: {e}")
+            logger.error("❌ Error during cleanup: %s", e)
     
     def is_available(self) -> bool:
         """Check if the service is available"""
@@ -28,6 +28,19 @@ class ModelConfig:
     # Streaming optimization settings
     streaming_chunk_size: int = 1  # Process every single token for maximum speed
     max_streaming_delay: float = 0.1  # Maximum delay between chunks (100ms)
+    
+    # SDK-level retries with exponential backoff for transient failures (429s, timeouts, 5xx)
+    max_retries: int = 3
+    
+    # Concurrency limit for parallel validation calls (provider rate limits)
+    max_concurrent_validation_calls: int = 3
+    
+    # Provider prompt caching for the system prompt + conversation prefix (Claude cache_control)
+    enable_prompt_caching: bool = True
+    
+    # Race GPT and Claude for non-streaming responses instead of falling back serially
+    # (cuts tail latency when GPT is degraded, at roughly double the API cost)
+    speculative_fallback: bool = False
 
 
 @dataclass
@@ -43,10 +56,18 @@ class AudioConfig:
     use_parallel_tts: bool = True
     max_workers: int = 16  # Increased from 8 for more parallel processing
     max_chunk_size: int = 150  # Increased from 100 for more efficient chunks
+    min_split_size: int = 225  # Texts up to this length go out as one TTS request (1.5x max_chunk_size)
+    # TTS requests in flight across all streams; use 1 for a local (e.g. ONNX) backend
+    tts_concurrency: int = 4
+    # In-memory LRU of synthesized audio for repeated phrases, bounded in bytes (0 disables)
+    tts_cache_max_bytes: int = 32 * 1024 * 1024
     
     # Streaming audio optimization
     streaming_buffer_size: int = 4096  # Reduced from 8192 for faster streaming
     tts_timeout: float = 1.5  # Reduced from 2.0 for faster timeout
+    # Extra attempts per parallel TTS chunk on 429/5xx/connection errors, with jittered exponential backoff
+    tts_retries: int = 2
+    tts_retry_backoff: float = 0.15  # seconds before the first retry, doubled per attempt
 
 
 @dataclass
@@ -55,6 +76,10 @@ class SessionConfig:
     max_conversation_length: int = 20
     trim_to_length: int = 15
     session_timeout_minutes: int = 30
+    
+    # Optional SQLite persistence (disabled when no path is set)
+    storage_path: str = os.getenv("SESSION_DB_PATH", "")
+    snapshot_interval: int = 10  # Full snapshot every N appended entries
 
 
 @dataclass
@@ -62,6 +87,12 @@ class APIConfig:
     """Configuration for API keys and endpoints"""
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
     anthropic_api_key: str = os.getenv("ANTHROPIC_API_KEY", "")
+    
+    # Connection pool shared by the GPT, Claude and audio clients
+    max_connections: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    max_keepalive_connections: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "100"))
+    request_timeout: float = 30.0
+    connect_timeout: float = 5.0
 
 
 class Settings:
@@ -3,20 +3,35 @@
 Session Manager Implementation - In-memory session management
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+import threading
+import time
+from dataclasses import replace
+from functools import partial
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime, timedelta
-from ...core.interfaces.session_service import ISessionManager, IConsentManager
-from ...core.entities.therapeutic_session import TherapeuticSession
+from ...core.interfaces.session_service import ISessionManager, IConsentManager, ISessionStorage
+from ...core.entities.therapeutic_session import TherapeuticSession, ConversationLog
 from ...infrastructure.config.settings import settings
 
 
 class SessionManager(ISessionManager):
-    """Session manager implementation using in-memory storage"""
+    """Session manager implementation using in-memory storage with optional persistence"""
     
-    def __init__(self):
+    def __init__(self, storage: Optional[ISessionStorage] = None):
         self.sessions: Dict[str, TherapeuticSession] = {}
         self.consent_manager = ConsentManager()
         
+        # Optional append-only persistence; tracks entries_added already written per session
+        self.storage = storage
+        self._persisted_counts: Dict[str, int] = {}
+        self._entries_since_snapshot: Dict[str, int] = {}
+        # Guards the bookkeeping for sync and async updates alike; storage writes run one at a
+        # time in the order their entries were captured
+        self._persist_lock = threading.Condition()
+        self._next_write_ticket = 0
+        self._serving_write_ticket = 0
+        
     def create_session(self, session_id: Optional[str] = None) -> TherapeuticSession:
         """Create a new session"""
         session = TherapeuticSession(
@@ -29,25 +44,123 @@ class SessionManager(ISessionManager):
         return session
     
     def get_session(self, session_id: str) -> Optional[TherapeuticSession]:
-        """Get session by ID"""
-        return self.sessions.get(session_id)
+        """Get session by ID, restoring it from storage when it is not in memory"""
+        session = self.sessions.get(session_id)
+        if session is None and self.storage:
+            restored = self.storage.retrieve_session(session_id)
+            if restored:
+                session = self._adopt_restored(restored)
+        return session
+    
+    async def get_session_async(self, session_id: str) -> Optional[TherapeuticSession]:
+        """Get session by ID, restoring it from storage on a worker thread when it is not in memory"""
+        session = self.sessions.get(session_id)
+        if session is None and self.storage:
+            restored = await asyncio.to_thread(self.storage.retrieve_session, session_id)
+            if restored:
+                session = self._adopt_restored(restored)
+        return session
+    
+    def _adopt_restored(self, restored: TherapeuticSession) -> TherapeuticSession:
+        """Cache a session replayed from storage, unless another caller restored it first"""
+        session = self.sessions.setdefault(restored.session_id, restored)
+        if session is restored:
+            # Everything replayed from storage is already persisted
+            with self._persist_lock:
+                self._persisted_counts[session.session_id] = session.entries_added
+                self._entries_since_snapshot[session.session_id] = 0
+        return session
     
     def update_session(self, session: TherapeuticSession) -> bool:
         """Update session"""
         try:
             self.sessions[session.session_id] = session
+            if self.storage:
+                with self._persist_lock:
+                    write = self._reserve_write(session)
+                return write()
             return True
         except Exception as e:
             print(f"Error updating session {session.session_id}: {e}")
             return False
     
-    def delete_session(self, session_id: str) -> bool:
-        """Delete session"""
+    async def update_session_async(self, session: TherapeuticSession) -> bool:
+        """Update session, writing to storage on a worker thread
+        
+        What needs writing is captured here on the event loop, so the worker never reads
+        the live session while later turns are being added to it.
+        """
         try:
-            if session_id in self.sessions:
-                del self.sessions[session_id]
+            self.sessions[session.session_id] = session
+            if not self.storage:
                 return True
+            with self._persist_lock:
+                write = self._reserve_write(session)
+            return await asyncio.to_thread(write)
+        except Exception as e:
+            print(f"Error updating session {session.session_id}: {e}")
             return False
+    
+    def _reserve_write(self, session: TherapeuticSession) -> Callable[[], bool]:
+        """Capture unpersisted entries and queue their storage write (caller holds _persist_lock)
+        
+        Entries are counted as persisted as soon as they are captured, so a concurrent update
+        only captures newer ones. A full snapshot is taken only periodically. The returned
+        write only touches the captured copy and runs after every earlier reserved write.
+        """
+        session_id = session.session_id
+        entries_added = session.entries_added
+        persisted = self._persisted_counts.get(session_id)
+        new_count = entries_added - (persisted or 0)
+        
+        # Snapshot when never stored, when unpersisted entries were already trimmed away,
+        # or when enough entries have been appended since the last snapshot
+        since_snapshot = self._entries_since_snapshot.get(session_id, 0) + new_count
+        if (
+            persisted is None or
+            new_count > len(session.conversation_history) or
+            since_snapshot >= settings.session_config.snapshot_interval
+        ):
+            snapshot = replace(
+                session,
+                conversation_history=ConversationLog(session.conversation_history),
+                metadata=dict(session.metadata)
+            )
+            write = partial(self.storage.store_session, snapshot)
+            since_snapshot = 0
+        else:
+            write = partial(self.storage.append_entries, session_id, session.conversation_history.tail(new_count))
+        
+        self._persisted_counts[session_id] = entries_added
+        self._entries_since_snapshot[session_id] = since_snapshot
+        ticket = self._next_write_ticket
+        self._next_write_ticket += 1
+        return partial(self._write_in_order, ticket, session_id, write)
+    
+    def _write_in_order(self, ticket: int, session_id: str, write: Callable[[], bool]) -> bool:
+        """Run a reserved storage write once every earlier one has finished"""
+        with self._persist_lock:
+            self._persist_lock.wait_for(lambda: self._serving_write_ticket == ticket)
+        stored = False
+        try:
+            stored = write()
+            return stored
+        finally:
+            with self._persist_lock:
+                # A failed write leaves a gap; forgetting the session forces a full snapshot next time
+                if not stored:
+                    self._forget_persisted(session_id)
+                self._serving_write_ticket += 1
+                self._persist_lock.notify_all()
+    
+    def delete_session(self, session_id: str) -> bool:
+        """Delete session from memory and, when configured, from storage"""
+        try:
+            in_memory = self.sessions.pop(session_id, None) is not None
+            self._forget_persisted(session_id)
+            # Evicted or pre-restart sessions live only in storage; remove them there too
+            in_storage = bool(self.storage) and self.storage.remove_session(session_id)
+            return in_memory or in_storage
         except Exception as e:
             print(f"Error deleting session {session_id}: {e}")
             return False
@@ -77,18 +190,31 @@ class SessionManager(ISessionManager):
     
     def cleanup_inactive_sessions(self, timeout_minutes: int = 30) -> int:
         """Clean up inactive sessions"""
-        cutoff_time = datetime.now() - timedelta(minutes=timeout_minutes)
-        inactive_sessions = []
-        
-        for session_id, session in self.sessions.items():
-            if session.last_activity < cutoff_time:
-                inactive_sessions.append(session_id)
+        now = time.monotonic()
+        inactive_sessions = [
+            session_id for session_id, session in self.sessions.items()
+            if not session.is_active(timeout_minutes, now)
+        ]
         
         for session_id in inactive_sessions:
-            del self.sessions[session_id]
+            session = self.sessions.pop(session_id)
+            # Closing a session takes a final snapshot, queued behind any pending appends,
+            # so persisted history is complete
+            if self.storage:
+                with self._persist_lock:
+                    self._forget_persisted(session_id)
+                    write = self._reserve_write(session)
+                write()
+            self._forget_persisted(session_id)
         
         return len(inactive_sessions)
     
+    def _forget_persisted(self, session_id: str):
+        """Drop persistence bookkeeping for a session"""
+        with self._persist_lock:
+            self._persisted_counts.pop(session_id, None)
+            self._entries_since_snapshot.pop(session_id, None)
+    
     def get_consent_manager(self) -> IConsentManager:
         """Get consent manager"""
         return self.consent_manager
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Session Storage Implementation - SQLite append-only session persistence
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional
+from ...core.interfaces.session_service import ISessionStorage
+from ...core.entities.therapeutic_session import TherapeuticSession, ConversationEntry
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteSessionStorage(ISessionStorage):
+    """
+    Session storage backed by SQLite in WAL mode.
+    Each conversation turn is appended as a single row; full snapshots
+    (store_session) rewrite a session's rows and are only taken periodically.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                created_at TEXT NOT NULL,
+                last_activity TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                max_conversation_length INTEGER NOT NULL,
+                trim_to_length INTEGER NOT NULL,
+                entries_added INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS entries (
+                session_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                timestamp TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                PRIMARY KEY (session_id, seq)
+            );
+            """
+        )
+        self._conn.commit()
+    
+    def store_session(self, session: TherapeuticSession) -> bool:
+        """Store a full session snapshot, replacing any appended entries"""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        session.session_id,
+                        session.created_at.isoformat(),
+                        session.last_activity.isoformat(),
+                        json.dumps(session.metadata, default=str),
+                        session.max_conversation_length,
+                        session.trim_to_length,
+                        session.entries_added
+                    )
+                )
+                self._conn.execute("DELETE FROM entries WHERE session_id = ?", (session.session_id,))
+                self._insert_entries(session.session_id, list(session.conversation_history), start_seq=0)
+            return True
+        except Exception as e:
+            logger.error("Error storing session %s: %s", session.session_id, e)
+            return False
+    
+    def append_entries(self, session_id: str, entries: List[ConversationEntry]) -> bool:
+        """Append conversation entries as new rows"""
+        if not entries:
+            return True
+        
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT COALESCE(MAX(seq) + 1, 0) FROM entries WHERE session_id = ?", (session_id,)
+                ).fetchone()
+                self._insert_entries(session_id, entries, start_seq=row[0])
+                self._conn.execute(
+                    "UPDATE sessions SET last_activity = ?, entries_added = entries_added + ? WHERE session_id = ?",
+                    (entries[-1].timestamp.isoformat(), len(entries), session_id)
+                )
+            return True
+        except Exception as e:
+            logger.error("Error appending entries for session %s: %s", session_id, e)
+            return False
+    
+    def retrieve_session(self, session_id: str) -> Optional[TherapeuticSession]:
+        """Retrieve session from its snapshot plus appended entries"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT created_at, last_activity, metadata, max_conversation_length, trim_to_length, entries_added "
+                "FROM sessions WHERE session_id = ?",
+                (session_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            entry_rows = self._conn.execute(
+                "SELECT role, content, timestamp, metadata FROM entries WHERE session_id = ? ORDER BY seq",
+                (session_id,)
+            ).fetchall()
+        
+        session = TherapeuticSession(
+            session_id=session_id,
+            created_at=datetime.fromisoformat(row[0]),
+            last_activity=datetime.fromisoformat(row[1]),
+            metadata=json.loads(row[2]),
+            max_conversation_length=row[3],
+            trim_to_length=row[4],
+            entries_added=row[5]
+        )
+        # Carry the stored idle time over to the monotonic activity clock
+        idle_seconds = (datetime.now() - session.last_activity).total_seconds()
+        session.last_activity_monotonic = time.monotonic() - idle_seconds
+        
+        # Replay appended rows through the same trimming rule as add_conversation_entry
+        history = session.conversation_history
+        for role, content, timestamp, metadata in entry_rows:
+            history.append(role, content, datetime.fromisoformat(timestamp), json.loads(metadata))
+            if len(history) > session.max_conversation_length:
+                history.trim(session.trim_to_length)
+        
+        return session
+    
+    def remove_session(self, session_id: str) -> bool:
+        """Remove session and its entries"""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM entries WHERE session_id = ?", (session_id,))
+                cursor = self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error("Error removing session %s: %s", session_id, e)
+            return False
+    
+    def list_all_sessions(self) -> List[str]:
+        """List all stored sessions"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT session_id FROM sessions")]
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+    
+    def _insert_entries(self, session_id: str, entries: List[ConversationEntry], start_seq: int):
+        """Insert entries with consecutive sequence numbers (caller holds the lock)"""
+        self._conn.executemany(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    session_id,
+                    start_seq + offset,
+                    entry.role,
+                    entry.content,
+                    entry.timestamp.isoformat(),
+                    json.dumps(entry.metadata, default=str)
+                )
+                for offset, entry in enumerate(entries)
+            ]
+        )
@@ -4,10 +4,12 @@ Main Application Composition Root - Dependency Injection Setup
 """
 
 from typing import Dict, Any
+import httpx
 from ..core.use_cases.therapy_interaction import TherapyInteractionUseCase
 from ..infrastructure.ai_services.ai_orchestrator import AIOrchestrator
 from ..infrastructure.audio_services.audio_service import AudioService
 from ..infrastructure.session_services.session_manager import SessionManager
+from ..infrastructure.session_services.session_storage import SQLiteSessionStorage
 from ..infrastructure.config.settings import settings
 
 
@@ -23,10 +25,23 @@ class Application:
         print("🚀 Initializing Indonesian Mental Health Support Bot (Clean Architecture)")
         print("💚 Menginisialisasi Bot Dukungan Kesehatan Mental Indonesia (Arsitektur Bersih)")
         
+        # Shared HTTP connection pool for every LLM, TTS and STT call
+        api_config = settings.api_config
+        limits = httpx.Limits(
+            max_connections=api_config.max_connections,
+            max_keepalive_connections=api_config.max_keepalive_connections
+        )
+        timeout = httpx.Timeout(api_config.request_timeout, connect=api_config.connect_timeout)
+        self.async_http_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        
         # Initialize infrastructure services
-        self.ai_orchestrator = AIOrchestrator()
-        self.audio_service = AudioService(settings.api_config.openai_api_key)
-        self.session_manager = SessionManager()
+        self.ai_orchestrator = AIOrchestrator(http_client=self.async_http_client)
+        self.audio_service = AudioService(api_config.openai_api_key, http_client=self.async_http_client)
+        self.session_storage = (
+            SQLiteSessionStorage(settings.session_config.storage_path)
+            if settings.session_config.storage_path else None
+        )
+        self.session_manager = SessionManager(storage=self.session_storage)
         
         # Validate API keys
         api_status = settings.validate_api_keys()
@@ -44,7 +59,8 @@ class Application:
             ai_orchestrator=self.ai_orchestrator,
             audio_service=self.audio_service,
             session_manager=self.session_manager,
-            system_prompt=settings.system_prompt
+            system_prompt=settings.system_prompt,
+            tts_concurrency=settings.audio_config.tts_concurrency
         )
         
         print("🧠 Therapy interaction use case initialized")
@@ -105,9 +121,16 @@ class Application:
             if cleaned_sessions > 0:
                 print(f"🧹 Cleaned up {cleaned_sessions} inactive sessions")
             
+            if self.session_storage:
+                self.session_storage.close()
+            
             print("✅ Application cleanup completed")
         except Exception as e:
             print(f"❌ Error during cleanup: {e}")
+    
+    async def aclose(self):
+        """Close the async HTTP connection pool (must run on the serving event loop)"""
+        await self.async_http_client.aclose()
 
 
 # Global application instance